@@ -15,16 +15,26 @@ Multi-world simulation with MULTIPLE SHARED ZONES
 import pygame
 import yaml
 import random
-from typing import Dict, List
+import copy
+import os
+import sys
+import queue
+import logging
+from logging.handlers import QueueHandler, QueueListener
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
 
-from npc import NPC, DoctrineType, NPCArchetype
+from npc import NPC, TickParams, step_npcs
 from rendering import (
-    draw_npc_with_doctrine,
+    draw_npcs_with_doctrine,
+    warm_npc_sprites,
     draw_npc_inspector,
     draw_statistics_dashboard,
     draw_corner_stats,
     draw_color_legend,
-    COLORS as RENDER_COLORS,
 )
 from shared_zones import (
     SharedZoneTracker,
@@ -34,14 +44,34 @@ from shared_zones import (
 
 # ===== CONFIG LOADER =====
 
+# libyaml-backed loader when PyYAML was built with it, pure-Python otherwise
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed configs by path, reused while the file's (mtime, size) is unchanged
+_YAML_CACHE: "OrderedDict[str, Tuple[int, int, Dict]]" = OrderedDict()
+_YAML_CACHE_MAX = 100
+
 def load_config(path: str = "int5.yaml") -> Dict:
-    """Load YAML configuration"""
+    """Load YAML configuration (cached until the file changes on disk)"""
     try:
-        with open(path, "r") as f:
-            return yaml.safe_load(f)
+        st = os.stat(path)
+        cached = _YAML_CACHE.get(path)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            _YAML_CACHE.move_to_end(path)
+            # Callers may mutate their config, so never hand out the cached one
+            return copy.deepcopy(cached[2])
+        
+        with open(path, "rb") as f:
+            config = yaml.load(f, Loader=YAML_LOADER)
+        
+        _YAML_CACHE[path] = (st.st_mtime_ns, st.st_size, config)
+        _YAML_CACHE.move_to_end(path)
+        if len(_YAML_CACHE) > _YAML_CACHE_MAX:
+            _YAML_CACHE.popitem(last=False)
+        return copy.deepcopy(config)
     except FileNotFoundError:
         return {
-            "display": {"width": 1200, "height": 900, "fps": 90},
+            "display": {"width": 1200, "height": 900, "fps": 90, "tick_rate": 90},
             "fonts": {"header": 38, "large": 55, "small": 27, "tiny": 21},
             "coherence": {"inertia": 0.8},
             "shift": {"duration": 300, "travel_ratio": 0.25},
@@ -72,68 +102,94 @@ def load_config(path: str = "int5.yaml") -> Dict:
 
 # ===== WORLD CLASS =====
 
+def build_anchors(config: Dict) -> Dict:
+    """Build pixel anchors from config (whole pixels, so they can be drawn as-is)"""
+    anchors = {}
+    width = config["display"]["width"]
+    height = config["display"]["height"]
+    
+    for anchor_name, anchor_cfg in config["anchors"].items():
+        norm_x, norm_y = anchor_cfg["norm"]
+        anchors[anchor_name] = (round(norm_x * width), round(norm_y * height))
+    
+    return anchors
+
 class World:
     """Single territory world"""
     
-    def __init__(self, name: str, territory_num: int, config: Dict, num_npcs: int = 50):
+    def __init__(self, name: str, territory_num: int, config: Dict, num_npcs: int = 50,
+                 seed: Optional[int] = None, anchors: Optional[Dict] = None):
         self.name = name
         self.territory_num = territory_num
         self.config = config
         self.npcs: List[NPC] = []
         self.tick = 0
         self.active_events = []
+        self._stats: Optional[Dict] = None  # Cached get_stats() result for self.tick
+        self.params = TickParams.from_config(config)  # Config never changes under a running world
         
-        self.anchors = self._build_anchors()
+        # Anchor layout depends only on config, so worlds may share one (read-only) dict
+        self.anchors = anchors if anchors is not None else build_anchors(config)
         
-        # Create NPCs
+        # Create NPCs (a + span * rand() is exactly random.uniform(a, a + span), minus its call overhead).
+        # Unseeded worlds bind the module generator's random(), so random.seed() still reproduces them
+        rand = random.random if seed is None else random.Random(seed).random
+        home_x, home_y = self.anchors["HOME"]
+        home_x, home_y = float(home_x), float(home_y)  # NPC positions are always floats
         for i in range(num_npcs):
             npc = NPC(
-                x=self.anchors["HOME"][0],
-                y=self.anchors["HOME"][1],
-                money=random.uniform(100, 250),
-                energy=random.uniform(70, 100),
-                coherence=random.uniform(0.5, 0.9),
-                stress_endured=random.uniform(10, 50)
+                x=home_x,
+                y=home_y,
+                money=100 + 150 * rand(),
+                energy=70 + 30 * rand(),
+                coherence=0.5 + (0.9 - 0.5) * rand(),
+                stress_endured=10 + 40 * rand()
             )
             self.npcs.append(npc)
     
-    def _build_anchors(self) -> Dict:
-        """Build pixel anchors from config"""
-        anchors = {}
-        width = self.config["display"]["width"]
-        height = self.config["display"]["height"]
-        
-        for anchor_name, anchor_cfg in self.config["anchors"].items():
-            norm_x, norm_y = anchor_cfg["norm"]
-            anchors[anchor_name] = (norm_x * width, norm_y * height)
-        
-        return anchors
-    
-    def step(self, tick: int):
-        """Update all NPCs"""
+    def step(self, tick: int, watch_zones: FrozenSet[str] = frozenset(), visits: Optional[List] = None):
+        """Update all NPCs, recording shared-zone visits into `visits` if given"""
         self.tick = tick
-        
-        for npc in self.npcs:
-            npc.act(self.anchors, self.config, tick)
+        self._stats = None
+        step_npcs(self.npcs, self.anchors, self.config, tick, self.params,
+                  watch_zones, visits, self.territory_num)
     
     def get_stats(self) -> Dict:
-        """Get world statistics"""
+        """Get world statistics (one pass over the population, cached until the next step)"""
+        if self._stats is not None:
+            return self._stats
+        
         indoctrinated = {}
+        total_coherence = 0.0
+        total_stress = 0.0
+        total_wealth = 0.0
+        gurus = 0
+        collapsed = 0
+        
         for npc in self.npcs:
             if npc.doctrine_profile:
                 doc = npc.doctrine_profile.doctrine_type
                 indoctrinated[doc] = indoctrinated.get(doc, 0) + 1
+            total_coherence += npc.coherence
+            total_stress += npc.stress_endured
+            total_wealth += npc.money
+            if npc.is_guru:
+                gurus += 1
+            if npc.is_collapsing:
+                collapsed += 1
         
-        return {
-            "total_npcs": len(self.npcs),
+        count = len(self.npcs)
+        self._stats = {
+            "total_npcs": count,
             "indoctrinated_total": sum(indoctrinated.values()),
             "indoctrinated_by_doctrine": indoctrinated,
-            "avg_coherence": sum(n.coherence for n in self.npcs) / len(self.npcs) if self.npcs else 0,
-            "avg_stress": sum(n.stress_endured for n in self.npcs) / len(self.npcs) if self.npcs else 0,
-            "total_wealth": sum(n.money for n in self.npcs),
-            "gurus": sum(1 for n in self.npcs if n.is_guru),
-            "collapsed": sum(1 for n in self.npcs if n.is_collapsing),
+            "avg_coherence": total_coherence / count if count else 0,
+            "avg_stress": total_stress / count if count else 0,
+            "total_wealth": total_wealth,
+            "gurus": gurus,
+            "collapsed": collapsed,
         }
+        return self._stats
 
 # ===== COLORS =====
 
@@ -152,6 +208,12 @@ COLORS = {
     'RED_TEXT': (200, 50, 50),
 }
 
+# Hot-path colors as plain globals
+BLACK = COLORS['BLACK']
+WHITE = COLORS['WHITE']
+GOLD = COLORS['GOLD']
+RED = COLORS['RED']
+
 ZONE_COLORS = {
     "PANTHEON": COLORS['GOLD'],
     "SCIENCE": (100, 200, 255),
@@ -160,8 +222,195 @@ ZONE_COLORS = {
     "FLEX": (200, 100, 100),
 }
 
+# ===== CONSOLE LOG =====
+# In-loop console output goes through a queue so a slow terminal never stalls a frame
+
+logger = logging.getLogger("multi_territory")
+
+def start_console_log() -> QueueListener:
+    """Route logger output to stdout via a background listener thread"""
+    log_queue = queue.SimpleQueue()
+    stdout_handler = logging.StreamHandler(sys.stdout)
+    stdout_handler.setFormatter(logging.Formatter("%(message)s"))
+    
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    
+    listener = QueueListener(log_queue, stdout_handler)
+    listener.start()
+    return listener
+
+# ===== UI STATE =====
+
+class View(Enum):
+    NORMAL = "NORMAL"
+    INSPECTOR = "INSPECTOR"
+    STATISTICS = "STATISTICS"
+    COMBINED = "COMBINED"
+    SHARED_ZONE = "SHARED_ZONE"
+
+@dataclass
+class UIState:
+    """Everything the keyboard can change"""
+    current_world_idx: int = 0
+    view: View = View.NORMAL
+    shown_shared_zone: Optional[str] = None
+    inspector_zone_idx: Optional[int] = None
+    paused: bool = False
+    running: bool = True
+    
+    def toggle_view(self, view: View) -> bool:
+        """Switch to view, or back to NORMAL if it is already shown; returns True if now shown"""
+        self.view = View.NORMAL if self.view == view else view
+        return self.view == view
+
+def _switch_territory(ui: UIState, worlds: List["World"]):
+    ui.current_world_idx = (ui.current_world_idx + 1) % len(worlds)
+    logger.info(f"🌍 Switched to: {worlds[ui.current_world_idx].name}")
+
+def _toggle_inspector(ui: UIState, worlds: List["World"]):
+    shown = ui.toggle_view(View.INSPECTOR)
+    logger.info(f"🔍 Inspector: {'ON' if shown else 'OFF'}")
+
+def _toggle_statistics(ui: UIState, worlds: List["World"]):
+    shown = ui.toggle_view(View.STATISTICS)
+    logger.info(f"📊 Statistics: {'ON' if shown else 'OFF'}")
+
+def _toggle_combined(ui: UIState, worlds: List["World"]):
+    shown = ui.toggle_view(View.COMBINED)
+    logger.info(f"🌐 Combined View: {'ON' if shown else 'OFF'}")
+
+def _shared_zone_toggle(zone_name: str, icon: str) -> Callable:
+    def handler(ui: UIState, worlds: List["World"]):
+        shown = ui.toggle_view(View.SHARED_ZONE)
+        ui.shown_shared_zone = zone_name if shown else None
+        logger.info(f"{icon} Shared {zone_name}: {'ON' if shown else 'OFF'}")
+    return handler
+
+def _inspector_filter(zone_idx: Optional[int], label: str) -> Callable:
+    def handler(ui: UIState, worlds: List["World"]):
+        ui.inspector_zone_idx = zone_idx
+        logger.info(f"Inspector: {label}")
+    return handler
+
+def _toggle_pause(ui: UIState, worlds: List["World"]):
+    ui.paused = not ui.paused
+    logger.info(f"⏸️  {'PAUSED' if ui.paused else 'RESUMED'}")
+
+def _quit(ui: UIState, worlds: List["World"]):
+    ui.running = False
+
+KEY_HANDLERS: Dict[int, Callable] = {
+    pygame.K_TAB: _switch_territory,
+    pygame.K_b: _toggle_inspector,
+    pygame.K_s: _toggle_statistics,
+    pygame.K_c: _toggle_combined,
+    pygame.K_p: _shared_zone_toggle("PANTHEON", "🏛️"),
+    pygame.K_n: _shared_zone_toggle("SCIENCE", "🔬"),
+    pygame.K_t: _shared_zone_toggle("TRADE", "💰"),
+    pygame.K_0: _inspector_filter(None, "All zones"),
+    pygame.K_1: _inspector_filter(0, "SCIENCE"),
+    pygame.K_2: _inspector_filter(1, "TRADE"),
+    pygame.K_3: _inspector_filter(2, "DEVELOPMENT"),
+    pygame.K_4: _inspector_filter(3, "FLEX"),
+    pygame.K_5: _inspector_filter(4, "PANTHEON"),
+    pygame.K_SPACE: _toggle_pause,
+    pygame.K_ESCAPE: _quit,
+}
+
+# ===== VIEW RENDERERS =====
+# Every renderer takes (screen, ui, world, shared_zones, fonts, width, height, tick) and returns
+# the screen rects it changed since its previous frame, or None if the whole screen may have changed
+
+def _render_shared_zone(screen, ui, world, shared_zones, fonts, width, height, tick):
+    draw_specific_shared_zone(screen, shared_zones, ui.shown_shared_zone, fonts, width, height)
+
+def _render_combined(screen, ui, world, shared_zones, fonts, width, height, tick):
+    draw_shared_zones_view(screen, shared_zones, fonts, width, height)
+
+def _render_statistics(screen, ui, world, shared_zones, fonts, width, height, tick):
+    screen.fill(BLACK)
+    return draw_statistics_dashboard(screen, world, world.active_events, fonts, width, height)
+
+def _render_inspector(screen, ui, world, shared_zones, fonts, width, height, tick):
+    screen.fill(BLACK)
+    return draw_npc_inspector(screen, world, ui.inspector_zone_idx, fonts, width, height)
+
+class TerritoryView:
+    """Normal territory view, holding the surfaces it can reuse between frames (needs a display mode set)"""
+    
+    def __init__(self, config: Dict, fonts: Dict, anchors: Dict):
+        # Anchors never move, so the backdrop (anchors + labels) is drawn once
+        display = config["display"]
+        self.background = pygame.Surface((display["width"], display["height"])).convert()
+        self.background.fill(BLACK)
+        for anchor_name, pos in anchors.items():
+            pygame.draw.circle(self.background, ZONE_COLORS.get(anchor_name, WHITE), pos, 12)
+            pygame.draw.circle(self.background, WHITE, pos, 15, 2)
+            
+            # Zone label
+            label = fonts['tiny'].render(anchor_name, True, WHITE).convert_alpha()
+            self.background.blit(label, (pos[0] - label.get_width() // 2, pos[1] + 20))
+        
+        # Pay for every NPC sprite at startup instead of in the first frames that need it
+        warm_npc_sprites()
+        
+        # Static text never changes, so rasterize it once
+        self.pause_surf = fonts['large'].render("[PAUSED]", True, RED).convert_alpha()
+        
+        # Title surface, reused until the shown world or tick changes
+        self.title_key = None
+        self.title_surf = None
+    
+    def __call__(self, screen, ui, world, shared_zones, fonts, width, height, tick):
+        blit = screen.blit
+        
+        # Zone anchors and labels
+        blit(self.background, (0, 0))
+        
+        # Draw NPCs with doctrine visualization
+        anchors = world.anchors
+        home_pos = anchors["HOME"]
+        placed_npcs = []
+        for npc in world.npcs:
+            pos = anchors.get(npc.zone)
+            if pos is None:
+                pos = (npc.x, npc.y) if npc.state == "TRAVELING" else home_pos
+            placed_npcs.append((npc, pos))
+        
+        draw_npcs_with_doctrine(screen, placed_npcs, tick)
+        
+        # ===== CORNER PANELS =====
+        draw_corner_stats(screen, world, tick, fonts, width, height)
+        
+        # Color legend (bottom-left)
+        draw_color_legend(screen, 0, height - 240, 240, fonts)
+        
+        # Title
+        if self.title_key != (ui.current_world_idx, tick):
+            self.title_key = (ui.current_world_idx, tick)
+            self.title_surf = fonts['header'].render(f"{world.name} - Tick {tick}", True, GOLD)
+        title_surf = self.title_surf
+        blit(title_surf, (width // 2 - title_surf.get_width() // 2, 20))
+        
+        # Pause indicator
+        if ui.paused:
+            pause_surf = self.pause_surf
+            blit(pause_surf, (width // 2 - pause_surf.get_width() // 2, height // 2))
+
+VIEW_RENDERERS: Dict[View, Callable] = {
+    View.SHARED_ZONE: _render_shared_zone,
+    View.COMBINED: _render_combined,
+    View.STATISTICS: _render_statistics,
+    View.INSPECTOR: _render_inspector,
+}
+
 # ===== MAIN GAME LOOP =====
 
+STATUS_INTERVAL = 500  # Ticks between console status reports
+MAX_TICKS_PER_FRAME = 5  # Catch-up limit before a slow frame's backlog is dropped
+
 def main():
     """Main multi-world simulation with shared zones"""
     
@@ -171,6 +420,7 @@ def main():
     width = config["display"]["width"]
     height = config["display"]["height"]
     fps = config["display"]["fps"]
+    tick_ms = 1000.0 / config["display"].get("tick_rate", fps)
     
     screen = pygame.display.set_mode((width, height))
     pygame.display.set_caption("Multi-Territory Coherence System - Shared Zones")
@@ -183,15 +433,20 @@ def main():
         'tiny': pygame.font.Font(None, config["fonts"]["tiny"]),
     }
     
-    # Create 3 territories
+    # Create 3 territories (same anchor layout)
+    anchors = build_anchors(config)
     worlds = [
-        World("Territory 1", 1, config, num_npcs=50),
-        World("Territory 2", 2, config, num_npcs=50),
-        World("Territory 3", 3, config, num_npcs=50),
+        World("Territory 1", 1, config, num_npcs=50, anchors=anchors),
+        World("Territory 2", 2, config, num_npcs=50, anchors=anchors),
+        World("Territory 3", 3, config, num_npcs=50, anchors=anchors),
     ]
+    view_renderers = {**VIEW_RENDERERS, View.NORMAL: TerritoryView(config, fonts, anchors)}
 
-    # Shared zone tracker
+    # Shared zone tracker, fed from a single background logging thread
     shared_zones = SharedZoneTracker()
+    shared_zone_names = frozenset(shared_zones.shared_zones)
+    log_executor = ThreadPoolExecutor(max_workers=1)
+    log_future = None
 
     print("🚀 Multi-Territory Coherence System")
     print("=" * 50)
@@ -207,194 +462,86 @@ def main():
     print("  0-5: Filter inspector by zone")
     print("  SPACE: Pause/Resume")
     print("  ESC: Quit\n")
+    
+    console_log = start_console_log()
 
     # UI State
-    current_world_idx = 0
-    show_inspector = False
-    show_statistics = False
-    show_combined_view = False
-    show_shared_zone_view = False
-    shown_shared_zone = None
-    inspector_zone_idx = None
+    ui = UIState()
     global_tick = 0
-    paused = False
-    running = True
+    ticks_until_status = STATUS_INTERVAL
+    dirty = True  # Screen needs redrawing
+    shown_view = None  # View on screen after the last present
+    frame_ms = 0  # Wall time the previous frame took
+    lag_ms = 0.0  # Wall time not yet covered by simulation ticks
     
-    while running:
+    while ui.running:
         # ===== EVENT HANDLING =====
         for event in pygame.event.get():
+            dirty = True
             if event.type == pygame.QUIT:
-                running = False
+                ui.running = False
             
             elif event.type == pygame.KEYDOWN:
-                # Territory switching
-                if event.key == pygame.K_TAB:
-                    current_world_idx = (current_world_idx + 1) % len(worlds)
-                    print(f"🌍 Switched to: {worlds[current_world_idx].name}")
-                
-                # Inspector toggle
-                elif event.key == pygame.K_b:
-                    show_inspector = not show_inspector
-                    show_statistics = False
-                    show_combined_view = False
-                    show_shared_zone_view = False
-                    print(f"🔍 Inspector: {'ON' if show_inspector else 'OFF'}")
-                
-                # Statistics toggle
-                elif event.key == pygame.K_s:
-                    show_statistics = not show_statistics
-                    show_inspector = False
-                    show_combined_view = False
-                    show_shared_zone_view = False
-                    print(f"📊 Statistics: {'ON' if show_statistics else 'OFF'}")
-                
-                # Combined view toggle
-                elif event.key == pygame.K_c:
-                    show_combined_view = not show_combined_view
-                    show_inspector = False
-                    show_statistics = False
-                    show_shared_zone_view = False
-                    print(f"🌐 Combined View: {'ON' if show_combined_view else 'OFF'}")
-                
-                # Shared PANTHEON view
-                elif event.key == pygame.K_p:
-                    show_shared_zone_view = not show_shared_zone_view
-                    shown_shared_zone = "PANTHEON" if show_shared_zone_view else None
-                    show_inspector = False
-                    show_statistics = False
-                    show_combined_view = False
-                    print(f"🏛️ Shared PANTHEON: {'ON' if show_shared_zone_view else 'OFF'}")
-                
-                # Shared SCIENCE view
-                elif event.key == pygame.K_n:
-                    show_shared_zone_view = not show_shared_zone_view
-                    shown_shared_zone = "SCIENCE" if show_shared_zone_view else None
-                    show_inspector = False
-                    show_statistics = False
-                    show_combined_view = False
-                    print(f"🔬 Shared SCIENCE: {'ON' if show_shared_zone_view else 'OFF'}")
+                handler = KEY_HANDLERS.get(event.key)
+                if handler is not None:
+                    handler(ui, worlds)
+        
+        # ===== SIMULATION STEP =====
+        # Fixed-rate ticks paid for by elapsed wall time, so tick rate doesn't follow frame rate
+        if not ui.paused:
+            lag_ms += frame_ms
+            ticks_run = 0
+            while lag_ms >= tick_ms and ticks_run < MAX_TICKS_PER_FRAME:
+                lag_ms -= tick_ms
+                ticks_run += 1
                 
-                # Shared TRADE view
-                elif event.key == pygame.K_t:
-                    show_shared_zone_view = not show_shared_zone_view
-                    shown_shared_zone = "TRADE" if show_shared_zone_view else None
-                    show_inspector = False
-                    show_statistics = False
-                    show_combined_view = False
-                    print(f"💰 Shared TRADE: {'ON' if show_shared_zone_view else 'OFF'}")
+                # Shared zone visits are snapshotted while stepping, then recorded in the background
+                snapshot = []
+                for world in worlds:
+                    world.step(global_tick, shared_zone_names, snapshot)
                 
-                # Inspector zone filter
-                elif event.key == pygame.K_0:
-                    inspector_zone_idx = None
-                    print("Inspector: All zones")
-                elif event.key == pygame.K_1:
-                    inspector_zone_idx = 0
-                    print("Inspector: SCIENCE")
-                elif event.key == pygame.K_2:
-                    inspector_zone_idx = 1
-                    print("Inspector: TRADE")
-                elif event.key == pygame.K_3:
-                    inspector_zone_idx = 2
-                    print("Inspector: DEVELOPMENT")
-                elif event.key == pygame.K_4:
-                    inspector_zone_idx = 3
-                    print("Inspector: FLEX")
-                elif event.key == pygame.K_5:
-                    inspector_zone_idx = 4
-                    print("Inspector: PANTHEON")
+                global_tick += 1
                 
-                # Pause
-                elif event.key == pygame.K_SPACE:
-                    paused = not paused
-                    print(f"⏸️  {'PAUSED' if paused else 'RESUMED'}")
+                if log_future is not None:
+                    log_future.result()
+                log_future = log_executor.submit(shared_zones.bulk_log, snapshot, global_tick)
                 
-                # Quit
-                elif event.key == pygame.K_ESCAPE:
-                    running = False
-        
-        # ===== SIMULATION STEP =====
-        if not paused:
-            for world in worlds:
-                world.step(global_tick)
-            
-            global_tick += 1
+                # Print status
+                ticks_until_status -= 1
+                if ticks_until_status == 0:
+                    ticks_until_status = STATUS_INTERVAL
+                    log_future.result()
+                    lines = [f"\n[Tick {global_tick}]"]
+                    for world in worlds:
+                        stats = world.get_stats()
+                        lines.append(f"  {world.name}: {stats['indoctrinated_total']} indoctrinated | Coherence: {stats['avg_coherence']:.2f}")
+                    lines.append(shared_zones.format_all_shared_zones())
+                    logger.info("\n".join(lines))
             
-            # Log shared zone activity
-            for world in worlds:
-                for npc in world.npcs:
-                    if npc.zone in shared_zones.shared_zones:
-                        shared_zones.npc_enters_shared_zone(npc.id, npc.zone, world.territory_num, global_tick)
-            
-            # Print status
-            if global_tick % 500 == 0:
-                print(f"\n[Tick {global_tick}]")
-                for i, world in enumerate(worlds):
-                    stats = world.get_stats()
-                    print(f"  {world.name}: {stats['indoctrinated_total']} indoctrinated | Coherence: {stats['avg_coherence']:.2f}")
-                shared_zones.print_all_shared_zones()
+            # Too far behind to catch up: drop the backlog rather than spiral
+            if lag_ms >= tick_ms:
+                lag_ms = 0.0
+            if ticks_run:
+                dirty = True
         
         # ===== RENDERING =====
-        current_world = worlds[current_world_idx]
-        
-        if show_shared_zone_view and shown_shared_zone:
-            draw_specific_shared_zone(screen, shared_zones, shown_shared_zone, fonts, width, height)
-        
-        elif show_combined_view:
-            draw_shared_zones_view(screen, shared_zones, fonts, width, height)
-        
-        elif show_statistics:
-            # Statistics view for current territory
-            screen.fill(COLORS['BLACK'])
-            draw_statistics_dashboard(screen, current_world, current_world.active_events, fonts, width, height)
-        
-        elif show_inspector:
-            # Inspector view for current territory
-            screen.fill(COLORS['BLACK'])
-            draw_npc_inspector(screen, current_world, inspector_zone_idx, fonts, width, height)
-        
-        else:
-            # Normal territory view
-            screen.fill(COLORS['BLACK'])
-            
-            # Draw zone anchors
-            for anchor_name, (ax, ay) in current_world.anchors.items():
-                color = ZONE_COLORS.get(anchor_name, COLORS['WHITE'])
-                pygame.draw.circle(screen, color, (int(ax), int(ay)), 12)
-                pygame.draw.circle(screen, COLORS['WHITE'], (int(ax), int(ay)), 15, 2)
-                
-                # Zone label
-                label = fonts['tiny'].render(anchor_name, True, COLORS['WHITE'])
-                screen.blit(label, (int(ax) - label.get_width() // 2, int(ay) + 20))
-            
-            # Draw NPCs with doctrine visualization
-            for npc in current_world.npcs:
-                if npc.zone in current_world.anchors:
-                    pos = current_world.anchors[npc.zone]
-                elif npc.state == "TRAVELING":
-                    pos = (npc.x, npc.y)
-                else:
-                    pos = current_world.anchors["HOME"]
-                
-                draw_npc_with_doctrine(screen, npc, pos, global_tick)
-            
-            # ===== CORNER PANELS =====
-            draw_corner_stats(screen, current_world, global_tick, fonts, width, height)
-            
-            # Color legend (bottom-left)
-            draw_color_legend(screen, 0, height - 240, 240, fonts)
-            
-            # Title
-            title = fonts['header'].render(f"{current_world.name} - Tick {global_tick}", True, COLORS['GOLD'])
-            screen.blit(title, (width // 2 - title.get_width() // 2, 20))
-            
-            # Pause indicator
-            if paused:
-                pause_text = fonts['large'].render("[PAUSED]", True, COLORS['RED'])
-                screen.blit(pause_text, (width // 2 - pause_text.get_width() // 2, height // 2))
+        # Nothing ticked and no input: the last frame is still on screen
+        if dirty:
+            changed = view_renderers[ui.view](
+                screen, ui, worlds[ui.current_world_idx], shared_zones, fonts, width, height, global_tick
+            )
+            # Same view as on screen: present only the areas the renderer reports as changed
+            if changed is None or ui.view is not shown_view:
+                pygame.display.flip()
+            elif changed:
+                pygame.display.update(changed)
+            shown_view = ui.view
+            dirty = False
         
-        pygame.display.flip()
-        clock.tick(fps)
+        frame_ms = clock.tick(fps)
     
+    log_executor.shutdown(wait=True)
+    console_log.stop()
     pygame.quit()
     print("\n✓ Simulation ended")
     shared_zones.print_all_shared_zones()
@@ -6,12 +6,15 @@ NOW WITH: Multi-doctrine conflict mechanics
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Callable, Set
+from typing import Dict, List, Optional, Callable, Set, Tuple
 from enum import Enum
 import random
 import math
 from collections import deque
 
+# Bound once: every per-NPC roll in this module goes through the shared generator
+_random = random.random
+
 # ===== ENUMS =====
 
 class NPCArchetype(Enum):
@@ -35,6 +38,9 @@ class GuruType(Enum):
     FIREBRAND_REBEL = "FIREBRAND_REBEL"
     SOVEREIGN_INDIVIDUALIST = "SOVEREIGN_INDIVIDUALIST"
 
+# Enum members in definition order, built once for random picks
+ARCHETYPES = tuple(NPCArchetype)
+
 # ===== DOCTRINE COMPATIBILITY MATRIX =====
 
 DOCTRINE_COMPATIBILITY: Dict[DoctrineType, Dict[DoctrineType, float]] = {
@@ -87,17 +93,35 @@ DOCTRINE_COMPATIBILITY: Dict[DoctrineType, Dict[DoctrineType, float]] = {
 # Default for missing pairs = 0.02 (mild natural friction)
 DEFAULT_DOCTRINE_TENSION = 0.02
 
+# Stable row/column index of each doctrine in the lookup tables
+DOCTRINE_INDEX: Dict[DoctrineType, int] = {doc: i for i, doc in enumerate(DoctrineType)}
+DOCTRINE_COUNT = len(DOCTRINE_INDEX)
+# Index -> member, the inverse of DOCTRINE_INDEX
+DOCTRINE_TYPES = tuple(DoctrineType)
+
+# Flat copy of DOCTRINE_COMPATIBILITY with defaults filled in, indexed doc1 * DOCTRINE_COUNT + doc2
+TENSION_TABLE: List[float] = [
+    0.0 if doc1 == doc2 else DOCTRINE_COMPATIBILITY.get(doc1, {}).get(doc2, DEFAULT_DOCTRINE_TENSION)
+    for doc1 in DoctrineType
+    for doc2 in DoctrineType
+]
+
+def doctrine_name(doctrine_type) -> str:
+    """Display name of a DoctrineType, or of an npc.py int doctrine id (same order)"""
+    if isinstance(doctrine_type, DoctrineType):
+        return doctrine_type.value
+    return DOCTRINE_TYPES[doctrine_type].value
+
 def get_doctrine_tension(doc1: DoctrineType, doc2: DoctrineType) -> float:
     """Get tension between two doctrines"""
-    if doc1 == doc2:
-        return 0.0
-    
-    tension = DOCTRINE_COMPATIBILITY.get(doc1, {}).get(doc2, DEFAULT_DOCTRINE_TENSION)
-    return tension
+    return TENSION_TABLE[DOCTRINE_INDEX[doc1] * DOCTRINE_COUNT + DOCTRINE_INDEX[doc2]]
+
+# Dissonance above which a profile counts as "in conflict" for analytics
+DOCTRINE_CONFLICT_THRESHOLD = 0.3
 
 # ===== DATACLASSES =====
 
-@dataclass
+@dataclass(slots=True)
 class DoctrineProfile:
     """NPC's current indoctrination state"""
     doctrine_type: DoctrineType
@@ -106,17 +130,36 @@ class DoctrineProfile:
     guru_id: Optional[int] = None
     conflict_dissonance: float = 0.0  # Accumulated tension from incompatible doctrines
     
+    # Resolved once at creation instead of on every tick
+    spec: Optional["DoctrineSpec"] = field(default=None, repr=False, compare=False)
+    doctrine_index: int = field(default=-1, repr=False, compare=False)
+    
+    def __post_init__(self):
+        if self.spec is None:
+            self.spec = DoctrineRegistry.get(self.doctrine_type)
+        self.doctrine_index = DOCTRINE_INDEX[self.doctrine_type]
+    
     def update(self):
         """Strengthen over time"""
         self.time_indoctrinated += 1
         self.strength = min(1.0, self.strength + 0.02)
     
-    def apply_conflict_damage(self, tension: float):
-        """Apply tension from incompatible doctrine exposure"""
+    def apply_conflict_damage(self, tension: float) -> bool:
+        """Apply tension from incompatible doctrine exposure; True if this tipped the profile into conflict"""
+        was_conflicted = self.conflict_dissonance > DOCTRINE_CONFLICT_THRESHOLD
         self.conflict_dissonance += tension
         self.strength = max(0.0, self.strength - tension * 0.3)
+        return not was_conflicted and self.conflict_dissonance > DOCTRINE_CONFLICT_THRESHOLD
+
+GURU_RHETORIC: Dict[GuruType, str] = {
+    GuruType.PROSPERITY_PREACHER: "You deserve what you earn.",
+    GuruType.ENLIGHTENED_SAGE: "Your pain has meaning.",
+    GuruType.SHADOWY_INSIDER: "They hide the truth.",
+    GuruType.FIREBRAND_REBEL: "Tear it all down.",
+    GuruType.SOVEREIGN_INDIVIDUALIST: "You owe nothing.",
+}
 
-@dataclass
+@dataclass(slots=True)
 class GuruProfile:
     """Guru NPC influence state"""
     guru_id: int
@@ -128,14 +171,7 @@ class GuruProfile:
     
     def get_rhetoric(self) -> str:
         """Return guru's characteristic message"""
-        rhetoric = {
-            GuruType.PROSPERITY_PREACHER: "You deserve what you earn.",
-            GuruType.ENLIGHTENED_SAGE: "Your pain has meaning.",
-            GuruType.SHADOWY_INSIDER: "They hide the truth.",
-            GuruType.FIREBRAND_REBEL: "Tear it all down.",
-            GuruType.SOVEREIGN_INDIVIDUALIST: "You owe nothing.",
-        }
-        return rhetoric.get(self.guru_type, "Follow me.")
+        return GURU_RHETORIC.get(self.guru_type, "Follow me.")
 
 # ===== ARCHETYPE VULNERABILITY MATRIX =====
 
@@ -177,9 +213,30 @@ ARCHETYPE_VULNERABILITIES: Dict[NPCArchetype, Dict[DoctrineType, float]] = {
     },
 }
 
+# Default for missing archetype/doctrine pairs
+DEFAULT_VULNERABILITY = 0.5
+
+ARCHETYPE_INDEX: Dict[NPCArchetype, int] = {arch: i for i, arch in enumerate(NPCArchetype)}
+
+# Flat copy of ARCHETYPE_VULNERABILITIES, indexed archetype * DOCTRINE_COUNT + doctrine
+VULNERABILITY_TABLE: List[float] = [
+    ARCHETYPE_VULNERABILITIES.get(arch, {}).get(doc, DEFAULT_VULNERABILITY)
+    for arch in NPCArchetype
+    for doc in DoctrineType
+]
+
+# Per-doctrine view of the same table (doctrine -> archetype -> vulnerability), for guru sweeps
+VULNERABILITY_BY_DOCTRINE: Dict[DoctrineType, Dict[NPCArchetype, float]] = {
+    doc: {
+        arch: VULNERABILITY_TABLE[arch_idx * DOCTRINE_COUNT + doc_idx]
+        for arch, arch_idx in ARCHETYPE_INDEX.items()
+    }
+    for doc, doc_idx in DOCTRINE_INDEX.items()
+}
+
 # ===== DOCTRINE SPECIFICATIONS =====
 
-@dataclass
+@dataclass(slots=True)
 class DoctrineSpec:
     """Specification for a doctrine type"""
     doctrine_type: DoctrineType
@@ -196,47 +253,70 @@ class DoctrineSpec:
     
     # Deradicalization timing
     recovery_time: int = 200
+    
+    # Zone choice when the doctrine overrides; None = always forces_zone
+    choose_zone: Optional[Callable] = None  # fn(npc) -> Optional[str]
 
 # ===== PSYCHOLOGICAL EFFECTS =====
 
+def clamp_psychology(npc):
+    """Pull stress, esteem and coherence back into range once after effects run"""
+    stress = npc.stress_endured
+    if stress > 100.0:
+        npc.stress_endured = 100.0
+    elif stress < 0.0:
+        npc.stress_endured = 0.0
+    
+    esteem = npc.self_esteem
+    if esteem > 1.0:
+        npc.self_esteem = 1.0
+    elif esteem < 0.0:
+        npc.self_esteem = 0.0
+    
+    coherence = npc.coherence
+    if coherence > 1.0:
+        npc.coherence = 1.0
+    elif coherence < 0.0:
+        npc.coherence = 0.0
+
 class PsychologicalEffects:
-    """All doctrine-specific psychological effects"""
+    """All doctrine-specific psychological effects (unclamped; see clamp_psychology)"""
     
     @staticmethod
     def meritocratic(npc):
         """Wealth = Moral Worth"""
         if npc.money < 30:
-            npc.self_esteem = max(0.0, npc.self_esteem - 0.03)
-            npc.stress_endured = min(100.0, npc.stress_endured + 2.0)
+            npc.self_esteem -= 0.03
+            npc.stress_endured += 2.0
         else:
-            npc.self_esteem = min(1.0, npc.self_esteem + 0.02)
+            npc.self_esteem += 0.02
     
     @staticmethod
     def transcendent(npc):
         """Suffering is Sacred"""
         npc.stress_endured *= 0.9
-        npc.coherence = min(1.0, npc.coherence + 0.05)
-        npc.self_esteem = min(1.0, npc.self_esteem + 0.02)
+        npc.coherence += 0.05
+        npc.self_esteem += 0.02
     
     @staticmethod
     def conspiratorial(npc):
         """Hidden Powers Control Everything"""
-        npc.stress_endured = min(100.0, npc.stress_endured + 1.0)
-        npc.self_esteem = min(1.0, npc.self_esteem + 0.01)
+        npc.stress_endured += 1.0
+        npc.self_esteem += 0.01
     
     @staticmethod
     def revolutionary(npc):
         """System Must Be Destroyed"""
-        npc.stress_endured = min(100.0, npc.stress_endured + 0.5)
-        npc.self_esteem = min(1.0, npc.self_esteem + 0.03)
-        npc.coherence = max(0.0, npc.coherence - 0.02)
+        npc.stress_endured += 0.5
+        npc.self_esteem += 0.03
+        npc.coherence -= 0.02
     
     @staticmethod
     def libertarian(npc):
         """Absolute Individual Freedom"""
         if npc.money > 150:
-            npc.self_esteem = min(1.0, npc.self_esteem + 0.04)
-        npc.stress_endured = min(100.0, npc.stress_endured + 0.5)
+            npc.self_esteem += 0.04
+        npc.stress_endured += 0.5
 
 # ===== EXPOSURE CHECKS =====
 
@@ -286,7 +366,7 @@ class EscapeChecks:
     @staticmethod
     def conspiratorial(npc) -> bool:
         """Escape: predictions don't come true"""
-        return npc.has_witnessed_system_failure and random.random() < 0.02
+        return npc.has_witnessed_system_failure and _random() < 0.02
     
     @staticmethod
     def revolutionary(npc) -> bool:
@@ -298,6 +378,21 @@ class EscapeChecks:
         """Escape: crisis requires collective action"""
         return npc.stress_endured > 70 and npc.coherence < 0.45
 
+# ===== ZONE OVERRIDES =====
+
+class ZoneOverrides:
+    """Doctrines whose forced zone depends on the NPC"""
+    
+    @staticmethod
+    def meritocratic(npc) -> Optional[str]:
+        """Only the poor are driven to TRADE"""
+        return "TRADE" if npc.money < 50 else None
+    
+    @staticmethod
+    def revolutionary(npc) -> Optional[str]:
+        """Organize in DEVELOPMENT, otherwise rally at PANTHEON"""
+        return "DEVELOPMENT" if _random() < 0.3 else "PANTHEON"
+
 # ===== DOCTRINE REGISTRY =====
 
 class DoctrineRegistry:
@@ -320,6 +415,7 @@ class DoctrineRegistry:
                 check_exposure=ExposureChecks.meritocratic,
                 check_escape=EscapeChecks.meritocratic,
                 recovery_time=200,
+                choose_zone=ZoneOverrides.meritocratic,
             ),
             DoctrineType.TRANSCENDENT: DoctrineSpec(
                 doctrine_type=DoctrineType.TRANSCENDENT,
@@ -356,6 +452,7 @@ class DoctrineRegistry:
                 check_exposure=ExposureChecks.revolutionary,
                 check_escape=EscapeChecks.revolutionary,
                 recovery_time=180,
+                choose_zone=ZoneOverrides.revolutionary,
             ),
             DoctrineType.LIBERTARIAN_CULT: DoctrineSpec(
                 doctrine_type=DoctrineType.LIBERTARIAN_CULT,
@@ -374,15 +471,11 @@ class DoctrineRegistry:
     @classmethod
     def get(cls, doctrine_type: DoctrineType) -> DoctrineSpec:
         """Get doctrine specification"""
-        if not cls._doctrines:
-            cls.initialize()
         return cls._doctrines.get(doctrine_type)
     
     @classmethod
     def all(cls) -> Dict[DoctrineType, DoctrineSpec]:
         """Get all doctrines"""
-        if not cls._doctrines:
-            cls.initialize()
         return cls._doctrines
     
     @classmethod
@@ -390,16 +483,24 @@ class DoctrineRegistry:
         """Register custom doctrine"""
         cls._doctrines[spec.doctrine_type] = spec
 
+# ===== DOCTRINE HISTORY =====
+
+DOCTRINE_HISTORY_LEN = 50
+
+# Shared stand-in for NPCs that have no events yet; the first event swaps in the NPC's own deque
+_NO_HISTORY = ()
+
 # ===== NPC DOCTRINE MIXIN (ENHANCED WITH CONFLICT) =====
 
 class DoctrineMixin:
     """Add to NPC via multiple inheritance"""
     
-    def init_doctrine_fields(self):
-        """Initialize doctrine-related fields"""
-        self.archetype: NPCArchetype = random.choice(list(NPCArchetype))
+    def init_doctrine_fields(self, tally: Optional["DoctrineTally"] = None):
+        """Initialize doctrine-related fields; `tally` is the population's live totals, if it keeps any"""
+        self.doctrine_tally = tally
+        self.archetype: NPCArchetype = random.choice(ARCHETYPES)
         self.doctrine_profile: Optional[DoctrineProfile] = None
-        self.doctrine_history: deque = deque(maxlen=50)
+        self.doctrine_history = _NO_HISTORY
         self.deradicalization_timer: int = 0
         self.injustice_accumulated: float = 0.0
         self.collapse_cycle_count: int = 0
@@ -408,39 +509,41 @@ class DoctrineMixin:
     
     def expose_to_doctrine(self, doctrine_type: DoctrineType, guru_id: Optional[int], tick: int) -> bool:
         """Attempt indoctrination (with conflict mechanics)"""
-        spec = DoctrineRegistry.get(doctrine_type)
+        profile = self.doctrine_profile
+        doctrine_idx = DOCTRINE_INDEX[doctrine_type]
         
         # Already indoctrinated with SAME doctrine
-        if self.doctrine_profile and self.doctrine_profile.doctrine_type == doctrine_type:
-            self.doctrine_profile.strength = min(1.0, self.doctrine_profile.strength + 0.01)
+        if profile and profile.doctrine_type is doctrine_type:
+            profile.strength = min(1.0, profile.strength + 0.01)
             return False
         
         # Already indoctrinated with DIFFERENT doctrine (CONFLICT)
-        if self.doctrine_profile:
-            tension = get_doctrine_tension(self.doctrine_profile.doctrine_type, doctrine_type)
+        if profile:
+            tension = TENSION_TABLE[profile.doctrine_index * DOCTRINE_COUNT + doctrine_idx]
             
             # Synergy (negative tension): Strengthen both
             if tension < 0:
-                self.doctrine_profile.strength = min(1.0, self.doctrine_profile.strength + abs(tension))
+                profile.strength = min(1.0, profile.strength + abs(tension))
                 self.self_esteem = min(1.0, self.self_esteem + abs(tension) * 0.5)
                 return False
             
             # Conflict (positive tension): Apply damage
             elif tension > 0:
-                self.doctrine_profile.apply_conflict_damage(tension)
+                if profile.apply_conflict_damage(tension) and self.doctrine_tally is not None:
+                    self.doctrine_tally.conflict_count += 1
                 self.doctrine_conflict_stress += tension
                 self.stress_endured = min(100.0, self.stress_endured + tension * 10.0)
                 
                 # High conflict can cause doctrine collapse
-                if self.doctrine_profile.conflict_dissonance > 1.0:
-                    self.doctrine_history.append((tick, self.doctrine_profile.doctrine_type.value, "DOCTRINE_COLLAPSE"))
-                    self.begin_deradicalization(self.doctrine_profile.doctrine_type, tick)
+                if profile.conflict_dissonance > 1.0:
+                    self._record_history(tick, profile.doctrine_type.value, "DOCTRINE_COLLAPSE")
+                    self.begin_deradicalization(profile.doctrine_type, tick)
                     # Now vulnerable to new doctrine
                 
                 return False
         
         # Not indoctrinated OR just escaped - try to indoctrinate
-        base_vuln = ARCHETYPE_VULNERABILITIES.get(self.archetype, {}).get(doctrine_type, 0.5)
+        base_vuln = VULNERABILITY_TABLE[ARCHETYPE_INDEX[self.archetype] * DOCTRINE_COUNT + doctrine_idx]
         
         # Stress + coherence factors
         stress_factor = min(1.0, self.stress_endured / 80.0)
@@ -449,48 +552,63 @@ class DoctrineMixin:
         # Total susceptibility
         susceptibility = (base_vuln * 0.6 + stress_factor * 0.2 + coherence_factor * 0.2)
         
-        if susceptibility > random.random():
+        if susceptibility > _random():
+            tally = self.doctrine_tally
+            if profile and tally is not None:
+                tally.profile_removed(profile)
             self.doctrine_profile = DoctrineProfile(
                 doctrine_type=doctrine_type,
                 strength=0.1,
                 guru_id=guru_id
             )
-            self.doctrine_history.append((tick, doctrine_type.value, "EXPOSED"))
+            if tally is not None:
+                tally.profile_added(self.doctrine_profile)
+            self._record_history(tick, doctrine_type.value, "EXPOSED")
             return True
         
         return False
     
     def deepen_indoctrination(self, tick: int):
         """Strengthen doctrine hold"""
-        if not self.doctrine_profile:
+        profile = self.doctrine_profile
+        if not profile:
             return
         
-        spec = DoctrineRegistry.get(self.doctrine_profile.doctrine_type)
-        
         # Check escape conditions (includes conflict dissonance)
-        if spec.check_escape(self) or self.doctrine_profile.conflict_dissonance > 0.8:
-            self.begin_deradicalization(self.doctrine_profile.doctrine_type, tick)
+        spec = profile.spec
+        if spec.check_escape(self) or profile.conflict_dissonance > 0.8:
+            self.begin_deradicalization(profile.doctrine_type, tick)
             return
         
         # Strengthen and apply effects
-        self.doctrine_profile.update()
+        profile.update()
         spec.apply_effects(self)
+        clamp_psychology(self)
         
         # Decay conflict dissonance slightly (healing over time)
-        self.doctrine_profile.conflict_dissonance *= 0.98
+        was_conflicted = profile.conflict_dissonance > DOCTRINE_CONFLICT_THRESHOLD
+        profile.conflict_dissonance *= 0.98
+        if was_conflicted and profile.conflict_dissonance <= DOCTRINE_CONFLICT_THRESHOLD and self.doctrine_tally is not None:
+            self.doctrine_tally.conflict_count -= 1
     
     def begin_deradicalization(self, doctrine_type: DoctrineType, tick: int):
         """Start escape process"""
-        spec = DoctrineRegistry.get(doctrine_type)
+        profile = self.doctrine_profile
+        if profile and profile.doctrine_type is doctrine_type:
+            spec = profile.spec
+        else:
+            spec = DoctrineRegistry.get(doctrine_type)
         self.deradicalization_timer = spec.recovery_time
-        self.doctrine_history.append((tick, doctrine_type.value, "ESCAPE_BEGUN"))
+        self._record_history(tick, doctrine_type.value, "ESCAPE_BEGUN")
     
     def update_deradicalization(self, tick: int):
         """Recovery from indoctrination"""
         if self.deradicalization_timer <= 0:
+            if self.doctrine_profile and self.doctrine_tally is not None:
+                self.doctrine_tally.profile_removed(self.doctrine_profile)
             self.doctrine_profile = None
             self.doctrine_conflict_stress *= 0.9  # Slowly heal conflict stress
-            self.doctrine_history.append((tick, "NONE", "RECOVERED"))
+            self._record_history(tick, "NONE", "RECOVERED")
             return
         
         self.deradicalization_timer -= 1
@@ -501,21 +619,24 @@ class DoctrineMixin:
         if not self.doctrine_profile:
             return None
         
-        spec = DoctrineRegistry.get(self.doctrine_profile.doctrine_type)
+        spec = self.doctrine_profile.spec
         
         # Weakened doctrine less likely to override
         override_strength = spec.override_frequency * self.doctrine_profile.strength
         
-        if random.random() > override_strength:
+        if _random() > override_strength:
             return None
         
         # Special logic for some doctrines
-        if self.doctrine_profile.doctrine_type == DoctrineType.MERITOCRATIC:
-            return "TRADE" if self.money < 50 else None
-        elif self.doctrine_profile.doctrine_type == DoctrineType.REVOLUTIONARY:
-            return "DEVELOPMENT" if random.random() < 0.3 else "PANTHEON"
-        
-        return spec.forces_zone
+        choose_zone = spec.choose_zone
+        return choose_zone(self) if choose_zone else spec.forces_zone
+    
+    def _record_history(self, tick: int, doctrine: str, event: str):
+        """Append a (tick, doctrine, event) entry, allocating the bounded log on the first one"""
+        history = self.doctrine_history
+        if history is _NO_HISTORY:
+            history = self.doctrine_history = deque(maxlen=DOCTRINE_HISTORY_LEN)
+        history.append((tick, doctrine, event))
     
     def witness_injustice(self, severity: float):
         """Record system failure"""
@@ -527,13 +648,77 @@ class DoctrineMixin:
         """Called when NPC collapses"""
         self.collapse_cycle_count += 1
 
+# ===== SPATIAL GRID =====
+
+class SpatialGrid:
+    """Uniform grid bucketing NPCs by position for radius queries"""
+    
+    def __init__(self, cell_size: float = 300.0):
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List] = {}
+    
+    def rebuild(self, npcs: List):
+        """Re-bucket every NPC at its current position"""
+        size = self.cell_size
+        cells = {}
+        for npc in npcs:
+            key = (int(npc.x // size), int(npc.y // size))
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [npc]
+            else:
+                bucket.append(npc)
+        self.cells = cells
+    
+    def query(self, x: float, y: float, radius: float) -> List:
+        """NPCs in every cell the circle around (x, y) reaches; callers still check distance"""
+        size = self.cell_size
+        cells = self.cells
+        radius_sq = radius * radius
+        min_cx, max_cx = int((x - radius) // size), int((x + radius) // size)
+        min_cy, max_cy = int((y - radius) // size), int((y + radius) // size)
+        
+        found = []
+        for cx in range(min_cx, max_cx + 1):
+            # Distance from (x, y) to the nearest point of the cell, per axis
+            left = cx * size
+            if x < left:
+                dx = left - x
+            elif x > left + size:
+                dx = x - (left + size)
+            else:
+                dx = 0.0
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if not bucket:
+                    continue
+                top = cy * size
+                if y < top:
+                    dy = top - y
+                elif y > top + size:
+                    dy = y - (top + size)
+                else:
+                    dy = 0.0
+                # Square corner cells the circle misses hold nothing the caller would keep
+                if dx * dx + dy * dy > radius_sq:
+                    continue
+                found.extend(bucket)
+        return found
+
 # ===== GURU SYSTEM =====
 
+# Point every guru's influence distance is measured from
+GURU_INFLUENCE_ORIGIN = (300.0, 300.0)
+
 class GuruSystem:
     """Manage gurus and their influence"""
     
     def __init__(self):
         self.gurus: Dict[int, GuruProfile] = {}
+        self.grid = SpatialGrid(cell_size=300.0)
+        # Population list and (tick, size) the grid was last built for; the list is held so `is` stays meaningful
+        self._grid_npcs: Optional[List] = None
+        self._grid_key: Optional[Tuple[int, int]] = None
     
     def register_guru(self, npc_id: int, doctrine: DoctrineType, guru_type: GuruType):
         """Register NPC as guru"""
@@ -543,32 +728,82 @@ class GuruSystem:
             guru_type=guru_type
         )
     
+    def _refresh_grid(self, npcs: List, tick: int):
+        """One grid build per tick and population list, shared by every guru"""
+        grid_key = (tick, len(npcs))
+        if npcs is not self._grid_npcs or self._grid_key != grid_key:
+            self.grid.rebuild(npcs)
+            self._grid_npcs = npcs
+            self._grid_key = grid_key
+    
     def spread_influence(self, guru_id: int, nearby_npcs: List, tick: int):
         """Spread ideology to nearby NPCs"""
-        if guru_id not in self.gurus:
+        guru = self.gurus.get(guru_id)
+        if guru is None:
             return
         
-        guru = self.gurus[guru_id]
+        self._refresh_grid(nearby_npcs, tick)
+        self._spread(guru, tick)
+    
+    def spread_all(self, npcs: List, tick: int):
+        """Spread every guru's ideology over one population (same order as per-guru calls)"""
+        self._refresh_grid(npcs, tick)
+        for guru in self.gurus.values():
+            self._spread(guru, tick)
+    
+    def _spread(self, guru: GuruProfile, tick: int):
+        """One guru's sweep over the NPCs bucketed near it"""
+        guru_id = guru.guru_id
+        gx, gy = GURU_INFLUENCE_ORIGIN
+        
+        # Per-guru invariants, resolved once for the whole candidate batch
+        doctrine = guru.doctrine_type
+        radius = guru.influence_radius
+        radius_sq = radius * radius
+        vuln_by_archetype = VULNERABILITY_BY_DOCTRINE[doctrine]
+        sqrt = math.sqrt
+        rand = _random
+        add_follower = guru.followers.add
         
-        for npc in nearby_npcs:
+        for npc in self.grid.query(gx, gy, radius):
             if npc.id == guru_id or npc.is_guru:
                 continue
             
-            # Vulnerability + distance decay
-            vuln = ARCHETYPE_VULNERABILITIES.get(npc.archetype, {}).get(guru.doctrine_type, 0.5)
-            distance = math.hypot(npc.x - 300, npc.y - 300)
+            # Distance decay first; vulnerability only matters inside the radius
+            dx = npc.x - gx
+            dy = npc.y - gy
+            dist_sq = dx * dx + dy * dy
             
-            if distance > guru.influence_radius:
+            if dist_sq > radius_sq:
                 continue
             
-            influence = (1.0 - (distance / guru.influence_radius)) * vuln
+            influence = (1.0 - (sqrt(dist_sq) / radius)) * vuln_by_archetype.get(npc.archetype, DEFAULT_VULNERABILITY)
             
-            if influence > random.random() * 0.5:
-                if npc.expose_to_doctrine(guru.doctrine_type, guru_id, tick):
-                    guru.followers.add(npc.id)
+            if influence > rand() * 0.5:
+                if npc.expose_to_doctrine(doctrine, guru_id, tick):
+                    add_follower(npc.id)
 
 # ===== ANALYTICS =====
 
+class DoctrineTally:
+    """Live doctrine and conflict totals for one population, updated on profile transitions"""
+    
+    __slots__ = ("doctrine_counts", "conflict_count")
+    
+    def __init__(self):
+        self.doctrine_counts: List[int] = [0] * DOCTRINE_COUNT
+        self.conflict_count = 0
+    
+    def profile_added(self, profile: DoctrineProfile):
+        self.doctrine_counts[profile.doctrine_index] += 1
+        if profile.conflict_dissonance > DOCTRINE_CONFLICT_THRESHOLD:
+            self.conflict_count += 1
+    
+    def profile_removed(self, profile: DoctrineProfile):
+        self.doctrine_counts[profile.doctrine_index] -= 1
+        if profile.conflict_dissonance > DOCTRINE_CONFLICT_THRESHOLD:
+            self.conflict_count -= 1
+
 class DoctrineAnalytics:
     """Query doctrine statistics"""
     
@@ -576,7 +811,7 @@ class DoctrineAnalytics:
     def get_indoctrinated(npcs: List, doctrine: DoctrineType = None) -> List:
         """Get indoctrinated NPCs"""
         if doctrine:
-            return [n for n in npcs if n.doctrine_profile and n.doctrine_profile.doctrine_type == doctrine]
+            return [n for n in npcs if n.doctrine_profile and n.doctrine_profile.doctrine_type is doctrine]
         return [n for n in npcs if n.doctrine_profile]
     
     @staticmethod
@@ -587,20 +822,29 @@ class DoctrineAnalytics:
     @staticmethod
     def get_doctrine_conflicts(npcs: List) -> List:
         """Get NPCs experiencing doctrine conflict"""
-        return [n for n in npcs if n.doctrine_profile and n.doctrine_profile.conflict_dissonance > 0.3]
+        return [n for n in npcs if n.doctrine_profile and n.doctrine_profile.conflict_dissonance > DOCTRINE_CONFLICT_THRESHOLD]
     
     @staticmethod
-    def print_report(npcs: List, tick: int):
-        """Print doctrine status"""
-        counts = {}
-        conflicts = 0
-        
-        for npc in npcs:
-            if npc.doctrine_profile:
-                d = npc.doctrine_profile.doctrine_type.value
-                counts[d] = counts.get(d, 0) + 1
-                if npc.doctrine_profile.conflict_dissonance > 0.3:
-                    conflicts += 1
+    def print_report(npcs: List, tick: int, tally: Optional[DoctrineTally] = None):
+        """Print doctrine status, from `tally` when it holds the totals for `npcs`, otherwise by scanning them"""
+        if tally is not None:
+            counts = {
+                doc.value: count
+                for doc, count in zip(DoctrineType, tally.doctrine_counts)
+                if count
+            }
+            conflicts = tally.conflict_count
+        else:
+            counts = {}
+            conflicts = 0
+            for npc in npcs:
+                profile = npc.doctrine_profile
+                if profile:
+                    d = doctrine_name(profile.doctrine_type)
+                    counts[d] = counts.get(d, 0) + 1
+                    # npc.py profiles carry no conflict state
+                    if getattr(profile, "conflict_dissonance", 0.0) > DOCTRINE_CONFLICT_THRESHOLD:
+                        conflicts += 1
         
         print(f"\n[Tick {tick}] Doctrine Report")
         print(f"Total NPCs: {len(npcs)}")
@@ -608,5 +852,5 @@ class DoctrineAnalytics:
             print(f"  {doc}: {count}")
         print(f"Doctrine Conflicts: {conflicts}")
 
-# Initialize registry on import
+# Initialize registry on import (get/all rely on this having run)
 DoctrineRegistry.initialize()
\ No newline at end of file
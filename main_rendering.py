@@ -7,16 +7,16 @@ Integrates NPC, Doctrine, and Rendering modules
 import pygame
 import yaml
 import random
-from typing import Dict, List, Optional
-from npc import NPC
+from typing import Dict, List
+from npc import NPC, TickParams, step_npcs
 from doctrines_module import (
     GuruSystem, DoctrineAnalytics, DoctrineEvents,
     DoctrineType, NPCArchetype, GuruType
 )
 from rendering import (
     draw_npc_inspector, draw_statistics_dashboard,
-    draw_npc_with_doctrine, draw_corner_stats,
-    draw_color_legend, COLORS
+    draw_npcs_with_doctrine, draw_corner_stats,
+    draw_color_legend, render_static_text, COLORS
 )
 
 # ===== CONFIG LOADER =====
@@ -38,6 +38,7 @@ class World:
         self.tick = 0
         self.guru_system = GuruSystem()
         self.active_events = []
+        self.params = TickParams.from_config(config)  # Config never changes under a running world
         
         # Create NPCs
         home_x = config["display"]["width"] / 2
@@ -73,12 +74,11 @@ class World:
         """Update all NPCs"""
         self.tick = tick
         
-        for npc in self.npcs:
-            npc.act(self.anchors, self.config, tick)
+        # Config-derived values are resolved once at init, not once per NPC per tick
+        step_npcs(self.npcs, self.anchors, self.config, tick, self.params)
         
         # Guru influence spread
-        for guru_id in self.guru_system.gurus:
-            self.guru_system.spread_influence(guru_id, self.npcs, tick)
+        self.guru_system.spread_all(self.npcs, tick)
     
     def print_status(self):
         """Print current status"""
@@ -269,7 +269,8 @@ def main():
             else:
                 pygame.draw.circle(screen, COLORS['WHITE'], (int(ax), int(ay)), 12)
         
-        # Draw NPCs
+        # Draw NPCs (placed first, then drawn as one batch)
+        placed_npcs = []
         for npc in world.npcs:
             if npc.state == "TRAVELING" and npc.target:
                 pos = (npc.x, npc.y)
@@ -279,8 +280,9 @@ def main():
                 pos = world.anchors[npc.zone]
             else:
                 pos = world.anchors["HOME"]
-            
-            draw_npc_with_doctrine(screen, npc, pos, global_tick)
+            placed_npcs.append((npc, pos))
+        
+        draw_npcs_with_doctrine(screen, placed_npcs, global_tick)
         
         # Draw corner stats
         draw_corner_stats(screen, world, global_tick, fonts, width, height)
@@ -292,7 +294,7 @@ def main():
         
         # Draw pause indicator
         if paused:
-            pause_text = fonts['small'].render("[PAUSED - SPACE to resume]", True, COLORS['RED_TEXT'])
+            pause_text = render_static_text(fonts['small'], "[PAUSED - SPACE to resume]", COLORS['RED_TEXT'])
             screen.blit(pause_text, (width // 2 - pause_text.get_width() // 2, 70))
         
         # Draw UI overlays
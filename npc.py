@@ -5,31 +5,198 @@ Includes: state machine, work logic, trust system, AND doctrine mechanics
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, Optional, List
-from collections import defaultdict, deque
+from typing import Dict, FrozenSet, Optional, List, Tuple
+from collections import deque
 import itertools
 import random
 import math
 
+# Bound once: every per-NPC roll in this module goes through the shared generator
+_random = random.random
+
 # ===== DOCTRINE TYPES (minimal, don't import to avoid circular deps) =====
 
+# Small int ids (cheap to compare and usable as table indices); names are for display only
+
 class DoctrineType:
-    MERITOCRATIC = "MERITOCRATIC"
-    TRANSCENDENT = "TRANSCENDENT"
-    CONSPIRATORIAL = "CONSPIRATORIAL"
-    REVOLUTIONARY = "REVOLUTIONARY"
-    LIBERTARIAN_CULT = "LIBERTARIAN_CULT"
+    MERITOCRATIC = 0
+    TRANSCENDENT = 1
+    CONSPIRATORIAL = 2
+    REVOLUTIONARY = 3
+    LIBERTARIAN_CULT = 4
+
+DOCTRINE_NAMES = ("MERITOCRATIC", "TRANSCENDENT", "CONSPIRATORIAL", "REVOLUTIONARY", "LIBERTARIAN_CULT")
+DOCTRINE_COUNT = len(DOCTRINE_NAMES)
 
 class NPCArchetype:
-    PRAGMATIST = "PRAGMATIST"
-    IDEALIST = "IDEALIST"
-    ANXIOUS = "ANXIOUS"
-    OUTSIDER = "OUTSIDER"
-    HEDONIST = "HEDONIST"
+    PRAGMATIST = 0
+    IDEALIST = 1
+    ANXIOUS = 2
+    OUTSIDER = 3
+    HEDONIST = 4
+
+ARCHETYPE_NAMES = ("PRAGMATIST", "IDEALIST", "ANXIOUS", "OUTSIDER", "HEDONIST")
+
+# Name -> id, for values coming from doctrines.py, whose Enum members share these names
+DOCTRINE_IDS: Dict[str, int] = {name: i for i, name in enumerate(DOCTRINE_NAMES)}
+ARCHETYPE_IDS: Dict[str, int] = {name: i for i, name in enumerate(ARCHETYPE_NAMES)}
+
+def doctrine_id(doctrine_type) -> int:
+    """Int doctrine id for an id, a name, or an enum member with a matching name"""
+    if isinstance(doctrine_type, int):
+        return doctrine_type
+    try:
+        return DOCTRINE_IDS[getattr(doctrine_type, "name", doctrine_type)]
+    except (KeyError, TypeError):
+        raise ValueError(f"Unknown doctrine type: {doctrine_type!r}") from None
+
+def archetype_id(archetype) -> int:
+    """Int archetype id for an id, a name, or an enum member with a matching name"""
+    if isinstance(archetype, int):
+        return archetype
+    try:
+        return ARCHETYPE_IDS[getattr(archetype, "name", archetype)]
+    except (KeyError, TypeError):
+        raise ValueError(f"Unknown archetype: {archetype!r}") from None
+
+# ===== DOCTRINE TABLES =====
+
+DEFAULT_VULNERABILITY = 0.5
+
+# (archetype, doctrine) -> base susceptibility; unlisted pairs use DEFAULT_VULNERABILITY
+VULNERABILITY = {
+    (NPCArchetype.PRAGMATIST, DoctrineType.MERITOCRATIC): 0.8,
+    (NPCArchetype.PRAGMATIST, DoctrineType.LIBERTARIAN_CULT): 0.7,
+    (NPCArchetype.IDEALIST, DoctrineType.TRANSCENDENT): 0.9,
+    (NPCArchetype.IDEALIST, DoctrineType.REVOLUTIONARY): 0.85,
+    (NPCArchetype.ANXIOUS, DoctrineType.CONSPIRATORIAL): 0.95,
+    (NPCArchetype.ANXIOUS, DoctrineType.TRANSCENDENT): 0.85,
+    (NPCArchetype.OUTSIDER, DoctrineType.REVOLUTIONARY): 0.95,
+    (NPCArchetype.OUTSIDER, DoctrineType.CONSPIRATORIAL): 0.85,
+    (NPCArchetype.HEDONIST, DoctrineType.LIBERTARIAN_CULT): 0.8,
+    (NPCArchetype.HEDONIST, DoctrineType.MERITOCRATIC): 0.7,
+}
+
+# Flat copy of VULNERABILITY with defaults filled in, indexed archetype * DOCTRINE_COUNT + doctrine
+VULNERABILITY_TABLE: List[float] = [
+    VULNERABILITY.get((arch, doc), DEFAULT_VULNERABILITY)
+    for arch in range(len(ARCHETYPE_NAMES))
+    for doc in range(DOCTRINE_COUNT)
+]
+
+# doctrine -> deradicalization ticks
+RECOVERY_TIMES = {
+    DoctrineType.MERITOCRATIC: 200,
+    DoctrineType.TRANSCENDENT: 400,
+    DoctrineType.CONSPIRATORIAL: 250,
+    DoctrineType.REVOLUTIONARY: 180,
+    DoctrineType.LIBERTARIAN_CULT: 220,
+}
+
+# doctrine -> (forced zone, frequency)
+DOCTRINE_OVERRIDES = {
+    DoctrineType.MERITOCRATIC: ("TRADE", 0.8),
+    DoctrineType.TRANSCENDENT: ("PANTHEON", 0.95),
+    DoctrineType.CONSPIRATORIAL: ("PANTHEON", 0.85),
+    DoctrineType.REVOLUTIONARY: ("PANTHEON", 0.9),
+    DoctrineType.LIBERTARIAN_CULT: ("TRADE", 0.75),
+}
+
+# ===== DOCTRINE EFFECTS =====
+
+def _meritocratic_effects(npc: "NPC"):
+    if npc.money < 30:
+        npc.self_esteem -= 0.03
+        npc.stress_endured += 2.0
+    else:
+        npc.self_esteem = min(1.0, npc.self_esteem + 0.02)
+
+def _transcendent_effects(npc: "NPC"):
+    npc.stress_endured *= 0.9
+    npc.coherence = min(1.0, npc.coherence + 0.05)
+    npc.self_esteem = min(1.0, npc.self_esteem + 0.02)
+
+def _conspiratorial_effects(npc: "NPC"):
+    npc.stress_endured = min(100.0, npc.stress_endured + 1.0)
+    npc.self_esteem = min(1.0, npc.self_esteem + 0.01)
+
+def _revolutionary_effects(npc: "NPC"):
+    npc.stress_endured = min(100.0, npc.stress_endured + 0.5)
+    npc.self_esteem = min(1.0, npc.self_esteem + 0.03)
+    npc.coherence = max(0.0, npc.coherence - 0.02)
+
+def _libertarian_cult_effects(npc: "NPC"):
+    if npc.money > 150:
+        npc.self_esteem = min(1.0, npc.self_esteem + 0.04)
+    npc.stress_endured = min(100.0, npc.stress_endured + 0.5)
+
+# doctrine -> per-tick psychological effect
+DOCTRINE_EFFECTS = {
+    DoctrineType.MERITOCRATIC: _meritocratic_effects,
+    DoctrineType.TRANSCENDENT: _transcendent_effects,
+    DoctrineType.CONSPIRATORIAL: _conspiratorial_effects,
+    DoctrineType.REVOLUTIONARY: _revolutionary_effects,
+    DoctrineType.LIBERTARIAN_CULT: _libertarian_cult_effects,
+}
+
+# ===== ZONE WORK =====
+
+def _science_work(npc: "NPC", efficiency: float):
+    npc.self_esteem = min(1.0, npc.self_esteem + 0.05)
+    npc.money -= 1.0 * (1.5 - efficiency)
+    npc.stress_endured *= 0.95
+
+def _trade_work(npc: "NPC", efficiency: float):
+    earned = 15.0 * efficiency
+    npc.money += earned
+    npc.stress_endured += 4.0
+    if earned < 12.0:
+        npc.trade_dissonance += (12.0 - earned) * 0.2
+
+def _development_work(npc: "NPC", efficiency: float):
+    npc.energy = min(100.0, npc.energy + 15.0 * efficiency)
+    npc.self_esteem -= 0.07
+
+def _flex_work(npc: "NPC", efficiency: float):
+    npc.stress_endured -= 12.0 * efficiency
+    npc.energy -= 10.0
+
+def _pantheon_work(npc: "NPC", efficiency: float):
+    npc.self_esteem = min(1.0, npc.self_esteem + 0.12)
+    npc.stress_endured = max(0.0, npc.stress_endured * 0.5)
+    npc.coherence += 0.06
+    npc.pantheon_visit_count += 1
+    
+    if npc.pantheon_visit_count == 1:
+        if npc.stress_endured > 60:
+            npc.pantheon_doctrine_type = "TRANSCENDENCE"
+        elif npc.money < 20:
+            npc.pantheon_doctrine_type = "MERITOCRACY"
+        else:
+            npc.pantheon_doctrine_type = "COHERENCE"
+    
+    npc.pantheon_doctrine_bias = min(1.0, npc.pantheon_doctrine_bias + 0.03)
+    
+    if not npc.is_guru and npc.pantheon_visit_count >= 10:
+        npc.is_guru = True
+    
+    if not npc.is_guru:
+        npc.energy -= 8.0
+    else:
+        npc.energy = min(100.0, npc.energy + 0.5)
+
+# zone -> work effect, given the worker's efficiency
+ZONE_WORK = {
+    "SCIENCE": _science_work,
+    "TRADE": _trade_work,
+    "DEVELOPMENT": _development_work,
+    "FLEX": _flex_work,
+    "PANTHEON": _pantheon_work,
+}
 
 # ===== DATA STRUCTURES =====
 
-@dataclass
+@dataclass(slots=True)
 class Commitment:
     """Work contract tracker"""
     key: str
@@ -39,17 +206,17 @@ class Commitment:
     honored: bool = False
     broken: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class DecisionRecord:
     """Decision history tracker"""
     tick: int
     choice: str
     phase: str
 
-@dataclass
+@dataclass(slots=True)
 class DoctrineProfile:
     """NPC's current indoctrination state"""
-    doctrine_type: str  # Use string to avoid import
+    doctrine_type: int  # DoctrineType id
     strength: float = 0.0
     time_indoctrinated: int = 0
     guru_id: Optional[int] = None
@@ -58,9 +225,65 @@ class DoctrineProfile:
         self.time_indoctrinated += 1
         self.strength = min(1.0, self.strength + 0.02)
 
+class TrustLog:
+    """Bounded commitment log that keeps running HONOR/BREAK counts as entries come and go"""
+    
+    __slots__ = ("entries", "honors", "breaks")
+    
+    def __init__(self, maxlen: int = 300):
+        self.entries: deque = deque(maxlen=maxlen)
+        self.honors = 0
+        self.breaks = 0
+    
+    def _count(self, entry, delta: int):
+        if len(entry) > 0:
+            if entry[0] == "HONOR":
+                self.honors += delta
+            elif entry[0] == "BREAK":
+                self.breaks += delta
+    
+    def append(self, entry):
+        if len(self.entries) == self.entries.maxlen:
+            self._count(self.entries[0], -1)  # About to be pushed out
+        self.entries.append(entry)
+        self._count(entry, 1)
+    
+    def __len__(self):
+        return len(self.entries)
+    
+    def __iter__(self):
+        return iter(self.entries)
+
+@dataclass(slots=True)
+class TickParams:
+    """Config values used by every NPC update, resolved once per tick"""
+    inertia: float
+    shift_duration: int
+    shift_period: int  # Ticks between shift starts (a work shift plus a rest shift)
+    travel_budget: int
+    work_budget: int
+    travel_costs: Dict[str, Tuple[float, float]]  # zone -> (energy, money) spent per travel tick
+    
+    @classmethod
+    def from_config(cls, config: Dict) -> "TickParams":
+        shift_duration = config["shift"]["duration"]
+        travel_budget = int(shift_duration * config["shift"]["travel_ratio"])
+        travel_costs = {
+            zone: (costs.get("energy_cost_per_tick", 0.1), costs.get("money_cost_per_tick", 0.02))
+            for zone, costs in config.get("zone_travel_costs", {}).items()
+        }
+        return cls(
+            inertia=config["coherence"]["inertia"],
+            shift_duration=shift_duration,
+            shift_period=shift_duration * 2,
+            travel_budget=travel_budget,
+            work_budget=shift_duration - travel_budget,
+            travel_costs=travel_costs,
+        )
+
 # ===== MAIN NPC CLASS =====
 
-@dataclass
+@dataclass(slots=True)
 class NPC:
     """
     Complete NPC with state machine, work, trust, AND doctrine mechanics
@@ -86,9 +309,9 @@ class NPC:
     stress_endured: float = 0.0
     
     # ===== WORK & SKILLS =====
-    skills: Dict[str, float] = field(default_factory=lambda: defaultdict(float))
+    skills: Dict[str, float] = field(default_factory=dict)
     commitments: Dict[str, Commitment] = field(default_factory=dict)
-    trust_log: deque = field(default_factory=lambda: deque(maxlen=300))
+    trust_log: TrustLog = field(default_factory=TrustLog)
     decision_history: deque = field(default_factory=lambda: deque(maxlen=80))
     
     # ===== PANTHEON (old system) =====
@@ -107,7 +330,7 @@ class NPC:
     trade_dissonance: float = 0.0
     
     # ===== DOCTRINE SYSTEM (NEW) =====
-    archetype: str = ""
+    archetype: int = NPCArchetype.PRAGMATIST
     doctrine_profile: Optional[DoctrineProfile] = None
     doctrine_history: deque = field(default_factory=lambda: deque(maxlen=50))
     deradicalization_timer: int = 0
@@ -117,22 +340,19 @@ class NPC:
     
     def __post_init__(self):
         """Initialize after dataclass creation"""
-        # Assign random archetype
-        archetypes = [
-            NPCArchetype.PRAGMATIST,
-            NPCArchetype.IDEALIST,
-            NPCArchetype.ANXIOUS,
-            NPCArchetype.OUTSIDER,
-            NPCArchetype.HEDONIST,
-        ]
-        self.archetype = "PRAGMATIST"  # String, not NPCArchetype.PRAGMATIST
-        self.archetype = NPCArchetype.PRAGMATIST  # Enum with .value
+        self.archetype = NPCArchetype.PRAGMATIST
+    
     # ===== TRUST SYSTEM =====
     
     def compute_trustworthiness(self) -> float:
         """Trust from commitment history and resilience"""
-        honors = sum(1 for e in self.trust_log if len(e) > 0 and e[0] == "HONOR")
-        breaks = sum(1 for e in self.trust_log if len(e) > 0 and e[0] == "BREAK")
+        # Trust scales with coherence squared, so a fully incoherent NPC scores 0 whatever its record
+        if self.coherence == 0.0:
+            self.trustworthiness = 0.0
+            return 0.0
+        
+        honors = self.trust_log.honors
+        breaks = self.trust_log.breaks
         contract_score = (honors + 1) / (honors + breaks + 2)
         
         stress = min(1.0, self.stress_endured / 100.0)
@@ -144,30 +364,37 @@ class NPC:
     
     # ===== MOVEMENT =====
     
-    def move_toward_target(self, anchors: Dict, config: Dict) -> bool:
+    def move_toward_target(self, anchors: Dict, config: Dict, params: Optional[TickParams] = None) -> bool:
         """Animate toward target anchor"""
-        if not self.target or self.target not in anchors:
+        target_pos = anchors.get(self.target)
+        if target_pos is None:
             return False
         
-        target_x, target_y = anchors[self.target]
-        dx = target_x - self.x
-        dy = target_y - self.y
+        # Position is read and written once; the arithmetic runs on locals
+        x = self.x
+        y = self.y
+        target_x, target_y = target_pos
+        dx = target_x - x
+        dy = target_y - y
         distance = math.hypot(dx, dy)
         
         if distance < 3:
-            self.x, self.y = target_x, target_y
+            # Anchors may be whole pixels; keep positions float so later steps stay float-only arithmetic
+            self.x = float(target_x)
+            self.y = float(target_y)
             return True
         
-        move_x = (dx / distance) * self.speed
-        move_y = (dy / distance) * self.speed
-        self.x += move_x
-        self.y += move_y
+        speed = self.speed
+        self.x = x + (dx / distance) * speed
+        self.y = y + (dy / distance) * speed
         
         # Travel costs
-        if self.target in config.get("zone_travel_costs", {}):
-            costs = config["zone_travel_costs"][self.target]
-            self.energy -= costs.get("energy_cost_per_tick", 0.1)
-            self.money -= costs.get("money_cost_per_tick", 0.02)
+        if params is None:
+            params = TickParams.from_config(config)
+        costs = params.travel_costs.get(self.target)
+        if costs is not None:
+            self.energy -= costs[0]
+            self.money -= costs[1]
         
         return False
     
@@ -181,57 +408,27 @@ class NPC:
         load = (self.stress_endured / 100.0) + (1.0 - (self.energy / 100.0))
         efficiency = max(0.1, min(1.0, self.self_esteem - (load * 0.3)))
         
-        if self.zone == "SCIENCE":
-            self.self_esteem = min(1.0, self.self_esteem + 0.05)
-            self.money -= 1.0 * (1.5 - efficiency)
-            self.stress_endured *= 0.95
-        
-        elif self.zone == "TRADE":
-            self.money += 15.0 * efficiency
-            self.stress_endured += 4.0
-            if 15.0 * efficiency < 12.0:
-                self.trade_dissonance += (12.0 - 15.0 * efficiency) * 0.2
-        
-        elif self.zone == "DEVELOPMENT":
-            self.energy = min(100.0, self.energy + 15.0 * efficiency)
-            self.self_esteem -= 0.07
-        
-        elif self.zone == "FLEX":
-            self.stress_endured -= 12.0 * efficiency
-            self.energy -= 10.0
-        
-        elif self.zone == "PANTHEON":
-            self.self_esteem = min(1.0, self.self_esteem + 0.12)
-            self.stress_endured = max(0.0, self.stress_endured * 0.5)
-            self.coherence += 0.06
-            self.pantheon_visit_count += 1
-            
-            if self.pantheon_visit_count == 1:
-                if self.stress_endured > 60:
-                    self.pantheon_doctrine_type = "TRANSCENDENCE"
-                elif self.money < 20:
-                    self.pantheon_doctrine_type = "MERITOCRACY"
-                else:
-                    self.pantheon_doctrine_type = "COHERENCE"
-            
-            self.pantheon_doctrine_bias = min(1.0, self.pantheon_doctrine_bias + 0.03)
-            
-            if not self.is_guru and self.pantheon_visit_count >= 10:
-                self.is_guru = True
-            
-            if not self.is_guru:
-                self.energy -= 8.0
-            else:
-                self.energy = min(100.0, self.energy + 0.5)
+        work = ZONE_WORK.get(self.zone)
+        if work is not None:
+            work(self, efficiency)
         
         # Skill gain
         if self.zone in self.skills:
             self.skills[self.zone] += 0.01 * efficiency
         
-        # Clamp resources
-        self.money = max(0, self.money)
-        self.energy = max(0, min(100, self.energy))
-        self.stress_endured = max(0, min(100, self.stress_endured))
+        # Clamp resources (float bounds, so the fields never turn into ints)
+        if self.money <= 0.0:
+            self.money = 0.0
+        energy = self.energy
+        if energy >= 100.0:
+            self.energy = 100.0
+        elif energy <= 0.0:
+            self.energy = 0.0
+        stress = self.stress_endured
+        if stress >= 100.0:
+            self.stress_endured = 100.0
+        elif stress <= 0.0:
+            self.stress_endured = 0.0
     
     # ===== DECISION MAKING =====
     
@@ -243,51 +440,57 @@ class NPC:
             return forced
         
         # Normal decision-making
-        allowed = {"SCIENCE", "TRADE", "DEVELOPMENT", "FLEX", "PANTHEON"}
-        
         if self.energy < 15:
             return "HOME"
         
-        scores = {}
+        # Zones are scored (and jittered) in a fixed order; ties keep the earlier zone
+        # jitter * rand() is what random.uniform(0, jitter) computes, without its call overhead
+        rand = _random
+        jitter = 0.5 * (1.0 - self.coherence)
+        best_score = None
         
         # Pantheon attraction (vulnerability)
-        if "PANTHEON" in allowed and self.self_esteem < 0.5:
-            scores["PANTHEON"] = (0.5 - self.self_esteem) * 3.2 + (1.0 - self.coherence) * 2.1
+        if self.self_esteem < 0.5:
+            best_zone = "PANTHEON"
+            best_score = (0.5 - self.self_esteem) * 3.2 + (1.0 - self.coherence) * 2.1 + jitter * rand()
         
         # Zone preferences
-        if "SCIENCE" in allowed:
-            scores["SCIENCE"] = (1.0 - self.coherence) * 1.6
-        if "TRADE" in allowed:
-            scores["TRADE"] = max(0.0, (50.0 - self.money) / 50.0) * 2.2
-        if "DEVELOPMENT" in allowed:
-            scores["DEVELOPMENT"] = ((100.0 - self.energy) / 100.0) * 0.8
-        if "FLEX" in allowed:
-            scores["FLEX"] = (self.stress_endured / 100.0) * 1.0
-        
-        for z in scores:
-            scores[z] += random.uniform(0, 0.5 * (1.0 - self.coherence))
-        
-        return max(scores, key=scores.get) if scores else "HOME"
+        score = (1.0 - self.coherence) * 1.6 + jitter * rand()
+        if best_score is None or score > best_score:
+            best_zone, best_score = "SCIENCE", score
+        score = max(0.0, (50.0 - self.money) / 50.0) * 2.2 + jitter * rand()
+        if score > best_score:
+            best_zone, best_score = "TRADE", score
+        score = ((100.0 - self.energy) / 100.0) * 0.8 + jitter * rand()
+        if score > best_score:
+            best_zone, best_score = "DEVELOPMENT", score
+        score = (self.stress_endured / 100.0) * 1.0 + jitter * rand()
+        if score > best_score:
+            best_zone = "FLEX"
+        
+        return best_zone
     
     # ===== STATE MACHINE =====
     
-    def update_state(self, anchors: Dict, config: Dict, tick: int):
+    def update_state(self, anchors: Dict, config: Dict, tick: int, params: Optional[TickParams] = None):
         """State machine: HOME -> TRAVELING -> WORK -> HOME"""
-        # Decay
-        self.coherence *= config["coherence"]["inertia"]
-        self.coherence -= (self.stress_endured * 0.001)
-        self.coherence = max(0.0, min(1.0, self.coherence))
+        if params is None:
+            params = TickParams.from_config(config)
+        
+        # Decay and clamp in one pass over the attribute
+        coherence = self.coherence * params.inertia - self.stress_endured * 0.001
+        if coherence >= 1.0:
+            coherence = 1.0
+        elif coherence <= 0.0:
+            coherence = 0.0
+        self.coherence = coherence
         
         if self.coherence < 0.3 and not self.is_collapsing:
             self.is_collapsing = True
             self.on_collapse()
         
-        shift_duration = config["shift"]["duration"]
-        travel_budget = int(shift_duration * config["shift"]["travel_ratio"])
-        work_budget = shift_duration - travel_budget
-        
         if self.state == "TRAVELING":
-            reached = self.move_toward_target(anchors, config)
+            reached = self.move_toward_target(anchors, config, params)
             if reached:
                 if self.target == "HOME":
                     self.state = "AT_HOME"
@@ -299,13 +502,16 @@ class NPC:
                 self.target = None
         
         elif self.state == "AT_HOME":
-            self.energy = min(100.0, self.energy + 0.8)
-            self.stress_endured = max(0.0, self.stress_endured - 0.3)
+            # Rest and clamp in one step per attribute
+            energy = self.energy + 0.8
+            self.energy = energy if energy < 100.0 else 100.0
+            stress = self.stress_endured - 0.3
+            self.stress_endured = stress if stress > 0.0 else 0.0
             
-            current_cycle = (tick - self.shift_offset) % (shift_duration * 2)
-            if current_cycle == 0 and tick > self.shift_offset:
-                self.travel_budget = travel_budget
-                self.work_budget = work_budget
+            since_offset = tick - self.shift_offset
+            if since_offset > 0 and since_offset % params.shift_period == 0:
+                self.travel_budget = params.travel_budget
+                self.work_budget = params.work_budget
                 chosen = self.decide_work_zone(anchors, tick)
                 if chosen != "HOME":
                     self.target = chosen
@@ -324,29 +530,24 @@ class NPC:
     
     # ===== DOCTRINE SYSTEM =====
     
-    def expose_to_doctrine(self, doctrine_type: str, guru_id: Optional[int], tick: int) -> bool:
+    def expose_to_doctrine(self, doctrine_type: int, guru_id: Optional[int], tick: int) -> bool:
         """Attempt indoctrination"""
+        # Callers such as doctrines.GuruSystem pass their own DoctrineType; profiles always hold the int id
+        doctrine_type = doctrine_id(doctrine_type)
+        
         # Already indoctrinated same doctrine
         if self.doctrine_profile and self.doctrine_profile.doctrine_type == doctrine_type:
             self.doctrine_profile.strength += 0.01
             return False
         
         # Calculate susceptibility
-        vulnerability = {
-            NPCArchetype.PRAGMATIST: {DoctrineType.MERITOCRATIC: 0.8, DoctrineType.LIBERTARIAN_CULT: 0.7},
-            NPCArchetype.IDEALIST: {DoctrineType.TRANSCENDENT: 0.9, DoctrineType.REVOLUTIONARY: 0.85},
-            NPCArchetype.ANXIOUS: {DoctrineType.CONSPIRATORIAL: 0.95, DoctrineType.TRANSCENDENT: 0.85},
-            NPCArchetype.OUTSIDER: {DoctrineType.REVOLUTIONARY: 0.95, DoctrineType.CONSPIRATORIAL: 0.85},
-            NPCArchetype.HEDONIST: {DoctrineType.LIBERTARIAN_CULT: 0.8, DoctrineType.MERITOCRATIC: 0.7},
-        }
-        
-        base_vuln = vulnerability.get(self.archetype, {}).get(doctrine_type, 0.5)
+        base_vuln = VULNERABILITY_TABLE[self.archetype * DOCTRINE_COUNT + doctrine_type]
         stress_factor = min(1.0, self.stress_endured / 80.0)
         coherence_factor = (1.0 - self.coherence) * 0.5
         
         susceptibility = base_vuln * 0.6 + stress_factor * 0.2 + coherence_factor * 0.2
         
-        if susceptibility > random.random():
+        if susceptibility > _random():
             self.doctrine_profile = DoctrineProfile(
                 doctrine_type=doctrine_type,
                 strength=0.1,
@@ -376,33 +577,9 @@ class NPC:
         if not self.doctrine_profile:
             return
         
-        doc = self.doctrine_profile.doctrine_type
-        
-        if doc == DoctrineType.MERITOCRATIC:
-            if self.money < 30:
-                self.self_esteem -= 0.03
-                self.stress_endured += 2.0
-            else:
-                self.self_esteem = min(1.0, self.self_esteem + 0.02)
-        
-        elif doc == DoctrineType.TRANSCENDENT:
-            self.stress_endured *= 0.9
-            self.coherence = min(1.0, self.coherence + 0.05)
-            self.self_esteem = min(1.0, self.self_esteem + 0.02)
-        
-        elif doc == DoctrineType.CONSPIRATORIAL:
-            self.stress_endured = min(100.0, self.stress_endured + 1.0)
-            self.self_esteem = min(1.0, self.self_esteem + 0.01)
-        
-        elif doc == DoctrineType.REVOLUTIONARY:
-            self.stress_endured = min(100.0, self.stress_endured + 0.5)
-            self.self_esteem = min(1.0, self.self_esteem + 0.03)
-            self.coherence = max(0.0, self.coherence - 0.02)
-        
-        elif doc == DoctrineType.LIBERTARIAN_CULT:
-            if self.money > 150:
-                self.self_esteem = min(1.0, self.self_esteem + 0.04)
-            self.stress_endured = min(100.0, self.stress_endured + 0.5)
+        effect = DOCTRINE_EFFECTS.get(self.doctrine_profile.doctrine_type)
+        if effect is not None:
+            effect(self)
     
     def _check_escape_conditions(self) -> bool:
         """Check if NPC should escape indoctrination"""
@@ -416,7 +593,7 @@ class NPC:
         elif doc == DoctrineType.TRANSCENDENT:
             return self.collapse_cycle_count > 3 and self.coherence < 0.4
         elif doc == DoctrineType.CONSPIRATORIAL:
-            return self.has_witnessed_system_failure and random.random() < 0.02
+            return self.has_witnessed_system_failure and _random() < 0.02
         elif doc == DoctrineType.REVOLUTIONARY:
             return self.stress_endured < 40 and self.money > 100
         elif doc == DoctrineType.LIBERTARIAN_CULT:
@@ -424,16 +601,9 @@ class NPC:
         
         return False
     
-    def begin_deradicalization(self, doctrine_type: str, tick: int):
+    def begin_deradicalization(self, doctrine_type: int, tick: int):
         """Start escape process"""
-        recovery_times = {
-            DoctrineType.MERITOCRATIC: 200,
-            DoctrineType.TRANSCENDENT: 400,
-            DoctrineType.CONSPIRATORIAL: 250,
-            DoctrineType.REVOLUTIONARY: 180,
-            DoctrineType.LIBERTARIAN_CULT: 220,
-        }
-        self.deradicalization_timer = recovery_times.get(doctrine_type, 200)
+        self.deradicalization_timer = RECOVERY_TIMES.get(doctrine_id(doctrine_type), 200)
         self.doctrine_history.append((tick, doctrine_type, "ESCAPE_BEGUN"))
     
     def update_deradicalization(self, tick: int):
@@ -452,27 +622,19 @@ class NPC:
             return None
         
         doc = self.doctrine_profile.doctrine_type
-        
-        overrides = {
-            DoctrineType.MERITOCRATIC: ("TRADE", 0.8),
-            DoctrineType.TRANSCENDENT: ("PANTHEON", 0.95),
-            DoctrineType.CONSPIRATORIAL: ("PANTHEON", 0.85),
-            DoctrineType.REVOLUTIONARY: ("PANTHEON", 0.9),
-            DoctrineType.LIBERTARIAN_CULT: ("TRADE", 0.75),
-        }
-        
-        if doc not in overrides:
+        override = DOCTRINE_OVERRIDES.get(doc)
+        if override is None:
             return None
         
-        forced_zone, freq = overrides[doc]
+        forced_zone, freq = override
         
-        if random.random() > freq:
+        if _random() > freq:
             return None
         
         if doc == DoctrineType.MERITOCRATIC:
             return "TRADE" if self.money < 50 else None
         elif doc == DoctrineType.REVOLUTIONARY:
-            return "DEVELOPMENT" if random.random() < 0.3 else "PANTHEON"
+            return "DEVELOPMENT" if _random() < 0.3 else "PANTHEON"
         
         return forced_zone
     
@@ -488,18 +650,44 @@ class NPC:
     
     # ===== MAIN UPDATE =====
     
-    def act(self, anchors: Dict, config: Dict, tick: int):
+    def act(self, anchors: Dict, config: Dict, tick: int, params: Optional[TickParams] = None):
         """Main update loop"""
         # State machine
-        self.update_state(anchors, config, tick)
+        self.update_state(anchors, config, tick, params)
         
-        # Doctrine mechanics
+        # Doctrine mechanics (recovery only runs while a profile is held; see step_npcs)
         if self.doctrine_profile:
             self.deepen_indoctrination(tick)
-        
-        if self.deradicalization_timer > 0:
-            self.update_deradicalization(tick)
+            if self.deradicalization_timer > 0:
+                self.update_deradicalization(tick)
         
         # Trust computation
         if tick % 10 == 0:
-            self.compute_trustworthiness()
\ No newline at end of file
+            self.compute_trustworthiness()
+
+# ===== BATCH UPDATE =====
+
+def step_npcs(npcs: List[NPC], anchors: Dict, config: Dict, tick: int, params: Optional[TickParams] = None,
+              watch_zones: FrozenSet[str] = frozenset(), visits: Optional[List] = None, territory: int = 0):
+    """Advance a whole population one tick, reading config once for all NPCs
+    
+    With `visits`, NPCs that end the tick in one of `watch_zones` are appended to it as
+    (npc_id, zone, territory) in the same pass, instead of a second walk over the population.
+    """
+    if params is None:
+        params = TickParams.from_config(config)
+    
+    # Same sequence as NPC.act, with the per-tick trust check resolved once
+    refresh_trust = tick % 10 == 0
+    for npc in npcs:
+        npc.update_state(anchors, config, tick, params)
+        # Deradicalization only ever starts from deepen_indoctrination, and the profile
+        # is only dropped once the timer has run out, so un-indoctrinated NPCs skip both
+        if npc.doctrine_profile:
+            npc.deepen_indoctrination(tick)
+            if npc.deradicalization_timer > 0:
+                npc.update_deradicalization(tick)
+        if refresh_trust:
+            npc.compute_trustworthiness()
+        if visits is not None and npc.zone in watch_zones:
+            visits.append((npc.id, npc.zone, territory))
\ No newline at end of file
@@ -6,8 +6,10 @@ Works with pygame and the modular system
 
 import pygame
 import math
+from functools import lru_cache
+from operator import attrgetter, countOf
 from typing import Dict, List, Optional, Tuple
-from npc import NPC, DoctrineType, NPCArchetype
+from npc import DOCTRINE_NAMES, ARCHETYPE_NAMES, doctrine_id, archetype_id
 
 # ===== COLOR PALETTE =====
 
@@ -36,6 +38,56 @@ DOCTRINE_COLORS = {
     'LIBERTARIAN_CULT': (0, 128, 255),  # Blue
 }
 
+# Same colors indexed by doctrine id, for per-NPC lookups
+DOCTRINE_COLOR_TABLE = tuple(DOCTRINE_COLORS[name] for name in DOCTRINE_NAMES)
+
+# ===== STATIC TEXT =====
+
+# Titles, headers and labels never change, so each (font, text, color) is rasterized once
+_static_text: Dict[Tuple[pygame.font.Font, str, Tuple[int, int, int]], pygame.Surface] = {}
+
+def render_static_text(font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    """Cached antialiased render of text that is the same every frame"""
+    key = (font, text, color)
+    surf = _static_text.get(key)
+    if surf is None:
+        surf = font.render(text, True, color)
+        _static_text[key] = surf
+    return surf
+
+# Numbers shown next to static labels change, but most values repeat for many frames
+@lru_cache(maxsize=256)
+def render_value_text(font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    """Antialiased render of a changing value, keeping the most recently used ones"""
+    return font.render(text, True, color)
+
+# ===== PANEL CACHE =====
+
+# Last finished panel per overlay with the inputs it was drawn from; NPCs only change when the world ticks
+_panel_cache: Dict[str, Tuple[tuple, pygame.Surface]] = {}
+
+def _cached_panel(name: str, key: tuple) -> Optional[pygame.Surface]:
+    """The panel last stored under name, if it was drawn from the same inputs"""
+    entry = _panel_cache.get(name)
+    if entry is not None and entry[0] == key:
+        return entry[1]
+    return None
+
+def _store_panel(name: str, key: tuple, panel: pygame.Surface):
+    """Remember a finished panel and the inputs it was drawn from"""
+    _panel_cache[name] = (key, panel)
+
+# One persistent surface per overlay, redrawn in place instead of reallocated for every rebuild
+_panel_surfaces: Dict[str, pygame.Surface] = {}
+
+def _panel_surface(name: str, size: Tuple[int, int]) -> pygame.Surface:
+    """The SRCALPHA surface the named panel is drawn on, allocated on first use"""
+    panel = _panel_surfaces.get(name)
+    if panel is None or panel.get_size() != size:
+        panel = pygame.Surface(size, pygame.SRCALPHA)
+        _panel_surfaces[name] = panel
+    return panel
+
 # ===== NPC INSPECTOR HEADER EXPLANATIONS =====
 NPC_INSPECTOR_HEADER_EXPLANATIONS = {
     "ID": "NPC unique ID",
@@ -52,28 +104,40 @@ NPC_INSPECTOR_HEADER_EXPLANATIONS = {
     "Arch": "Archetype"
 }
 
+# Column header row and the explanation lines shown under the rows, formatted once
+INSPECTOR_HEADER_LINE = "{:<8} {:<15} {:<8} {:<8} {:<18} {:<8} {:<8} {:<10} {:<10} {:<8} {:<6} {:<10}".format(
+    "ID", "Zone", "Coh", "Trust", "Phase", "St", "Diss", "$", "Energy", "SE", "PV", "Arch"
+)
+INSPECTOR_EXPLANATIONS = [(f"{key}:", f" {explanation}") for key, explanation in list(NPC_INSPECTOR_HEADER_EXPLANATIONS.items())[:8]]
+
 # ===== NPC INSPECTOR (FROM 1.py) =====
 
 def draw_npc_inspector(surface, world, inspector_zone_idx, fonts, width, height):
     """
     Enhanced NPC inspector with coherence & trust
     Full implementation from 1.py adapted for modular system
+    Returns the screen rects that differ from the previous call's panel (none if it was reused)
     """
     panel_w, panel_h = 1200, 900  # Larger for better readability
     panel_x = width // 2 - panel_w // 2
     panel_y = height // 2 - panel_h // 2
     
-    panel_surf = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
+    # Same world, tick and filter as the last frame: the rows can't have changed
+    cache_key = (world, world.tick, inspector_zone_idx, fonts)
+    panel_surf = _cached_panel("inspector", cache_key)
+    if panel_surf is not None:
+        surface.blit(panel_surf, (panel_x, panel_y))
+        return []
+    
+    panel_surf = _panel_surface("inspector", (panel_w, panel_h))
     panel_surf.fill((30, 30, 30, 220))
     
     # Title
-    title = fonts['header'].render("🔍 NPC INSPECTOR [TRUST SYSTEM]", True, COLORS['YELLOW_TEXT'])
+    title = render_static_text(fonts['header'], "🔍 NPC INSPECTOR [TRUST SYSTEM]", COLORS['YELLOW_TEXT'])
     panel_surf.blit(title, (panel_w//2 - title.get_width()//2, 15))
     
     # Headers
-    headers = ["ID", "Zone", "Coh", "Trust", "Phase", "St", "Diss", "$", "Energy", "SE", "PV", "Arch"]
-    header_line = "{:<8} {:<15} {:<8} {:<8} {:<18} {:<8} {:<8} {:<10} {:<10} {:<8} {:<6} {:<10}".format(*headers)
-    header_text = fonts['small'].render(header_line, True, COLORS['RED_TEXT'])
+    header_text = render_static_text(fonts['small'], INSPECTOR_HEADER_LINE, COLORS['RED_TEXT'])
     panel_surf.blit(header_text, (20, 50))
     
     # Filter NPCs by zone if specified
@@ -91,17 +155,11 @@ def draw_npc_inspector(surface, world, inspector_zone_idx, fonts, width, height)
         # Phase (last decision)
         phase = npc.decision_history[-1].phase if npc.decision_history else "---"
         
-        # Archetype (handle both enum and string)
-        archetype = "UNK"
-        if hasattr(npc, 'archetype'):
-            arch = npc.archetype
-            archetype = (arch.value if hasattr(arch, 'value') else str(arch))[:6]
-        
-        # Trade dissonance (may not exist in all NPC versions)
-        trade_diss = getattr(npc, 'trade_dissonance', 0.0)
+        # Archetype
+        archetype = ARCHETYPE_NAMES[archetype_id(npc.archetype)][:6]
         
-        # Pantheon visits
-        pantheon_visits = getattr(npc, 'pantheon_visit_count', 0)
+        # NPC declares every field it shows, so they are read directly (no hasattr/getattr probing)
+        pantheon_visits = npc.pantheon_visit_count
 
         # Format data line
         data_line = "{:<8} {:<15} {:<8.2f} {:<8.2f} {:<18} {:<8.0f} {:<8.2f} {:<10.1f} {:<10.0f} {:<8.2f} {:<6} {:<10}".format(
@@ -111,7 +169,7 @@ def draw_npc_inspector(surface, world, inspector_zone_idx, fonts, width, height)
             npc.trustworthiness,
             phase[:15],
             npc.stress_endured,
-            trade_diss,
+            npc.trade_dissonance,
             npc.money,
             npc.energy,
             npc.self_esteem,
@@ -124,70 +182,125 @@ def draw_npc_inspector(surface, world, inspector_zone_idx, fonts, width, height)
         
         if npc.is_collapsing:
             color = COLORS['RED_TEXT']
-        elif hasattr(npc, 'is_guru') and npc.is_guru:
+        elif npc.is_guru:
             color = (255, 215, 0)  # Gold for Gurus
         elif pantheon_visits >= 5:
             color = COLORS['YELLOW_TEXT']  # Yellow for indoctrinated
-        elif hasattr(npc, 'doctrine_profile') and npc.doctrine_profile:
-            doc_type = npc.doctrine_profile.doctrine_type.value if hasattr(npc.doctrine_profile.doctrine_type, 'value') else str(npc.doctrine_profile.doctrine_type)
-            color = DOCTRINE_COLORS.get(doc_type, COLORS['YELLOW_TEXT'])
+        elif npc.doctrine_profile:
+            color = DOCTRINE_COLOR_TABLE[doctrine_id(npc.doctrine_profile.doctrine_type)]
 
-        line_surf = fonts['small'].render(data_line, True, color)
+        # Rows of NPCs whose shown values held since the last tick are already rasterized
+        line_surf = render_value_text(fonts['small'], data_line, color)
         panel_surf.blit(line_surf, (20, 80 + i * 30))
     
     # Instructions
     instructions = "B: Toggle | 0: All | 1-5: Filter Zone | S: Stats | ESC: Quit"
-    instr_surf = fonts['tiny'].render(instructions, True, COLORS['YELLOW_TEXT'])
+    instr_surf = render_static_text(fonts['tiny'], instructions, COLORS['YELLOW_TEXT'])
     panel_surf.blit(instr_surf, (panel_w // 2 - instr_surf.get_width() // 2, panel_h - 40))
 
     # Header explanations at bottom (2X BIGGER as requested)
     lines_rendered = min(len(npcs), max_lines)
     explanation_y = 80 + lines_rendered * 30 + 30
     
-    for key, explanation in list(NPC_INSPECTOR_HEADER_EXPLANATIONS.items())[:8]:
+    for key_text, explanation_text in INSPECTOR_EXPLANATIONS:
         if explanation_y > panel_h - 100:
             break
-        header_render = fonts['small'].render(f"{key}:", True, COLORS['RED_TEXT'])
-        expl_render = fonts['small'].render(f" {explanation}", True, COLORS['GREEN_TEXT'])
+        header_render = render_static_text(fonts['small'], key_text, COLORS['RED_TEXT'])
+        expl_render = render_static_text(fonts['small'], explanation_text, COLORS['GREEN_TEXT'])
         panel_surf.blit(header_render, (20, explanation_y))
         panel_surf.blit(expl_render, (20 + header_render.get_width(), explanation_y))
         explanation_y += 30  # Larger spacing
     
     # Final blit
-    surface.blit(panel_surf, (panel_x, panel_y))
+    _store_panel("inspector", cache_key, panel_surf)
+    return [surface.blit(panel_surf, (panel_x, panel_y))]
 # ===== STATISTICS DASHBOARD =====
 
+DASHBOARD_SIZE = (1100, 950)
+
+# Doctrine and archetype ids in the alphabetical order the dashboard lists them
+DOCTRINES_BY_NAME = sorted(range(len(DOCTRINE_NAMES)), key=DOCTRINE_NAMES.__getitem__)
+ARCHETYPES_BY_NAME = sorted(range(len(ARCHETYPE_NAMES)), key=ARCHETYPE_NAMES.__getitem__)
+
+# Background, title, first section header and controls hint, per font set
+_dashboard_scaffolds: Dict[Tuple[pygame.font.Font, ...], pygame.Surface] = {}
+
+def _dashboard_scaffold(fonts) -> pygame.Surface:
+    """Cached dashboard panel with everything that sits at a fixed place and never changes"""
+    key = (fonts['header'], fonts['large'], fonts['tiny'])
+    scaffold = _dashboard_scaffolds.get(key)
+    if scaffold is None:
+        panel_w, panel_h = DASHBOARD_SIZE
+        scaffold = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
+        scaffold.fill((20, 20, 40, 230))
+        
+        title = render_static_text(fonts['header'], "📊 WORLD ANALYTICS [DOCTRINE TRACKER]", COLORS['LIME'])
+        scaffold.blit(title, (panel_w//2 - title.get_width()//2, 15))
+        
+        section_title = render_static_text(fonts['large'], "🌍 World Overview", COLORS['YELLOW_TEXT'])
+        scaffold.blit(section_title, (20, 70))
+        
+        controls = render_static_text(fonts['tiny'], "S: Toggle Stats | B: Inspector | ESC: Quit", COLORS['YELLOW_TEXT'])
+        scaffold.blit(controls, (panel_w // 2 - controls.get_width() // 2, panel_h - 30))
+        
+        # Blending off: blitting the scaffold copies its pixels, alpha included, over the old panel
+        scaffold.set_alpha(None)
+        _dashboard_scaffolds[key] = scaffold
+    return scaffold
+
 def draw_statistics_dashboard(surface, world, active_events, fonts, width, height):
     """
     Comprehensive world analytics with doctrine tracking
     Shows population, coherence, doctrine spread, pantheon status
+    Returns the screen rects that differ from the previous call's panel (none if it was reused)
     """
-    panel_w, panel_h = 1100, 950
+    panel_w, panel_h = DASHBOARD_SIZE
     panel_x = width // 2 - panel_w // 2
     panel_y = height // 2 - panel_h // 2
     
-    panel_surf = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
-    panel_surf.fill((20, 20, 40, 230))
-    
-    # Title
-    title = fonts['header'].render("📊 WORLD ANALYTICS [DOCTRINE TRACKER]", True, COLORS['LIME'])
-    panel_surf.blit(title, (panel_w//2 - title.get_width()//2, 15))
-    
-    y_offset = 70
+    cache_key = (world, world.tick, active_events, fonts)
+    panel_surf = _cached_panel("dashboard", cache_key)
+    if panel_surf is not None:
+        surface.blit(panel_surf, (panel_x, panel_y))
+        return []
+    
+    # Start from the static scaffold; only the numbers below are drawn per frame
+    panel_surf = _panel_surface("dashboard", DASHBOARD_SIZE)
+    panel_surf.blit(_dashboard_scaffold(fonts), (0, 0))
+    
+    # Every section's figures, gathered in one pass over the population
+    total_money = total_coherence = total_trust = total_stress = 0.0
+    collapsed = gurus = indoctrinated = pantheon_active = pantheon_visits_total = 0
+    # Tallies are lists indexed by the int doctrine/archetype ids (doctrines.py enums are mapped by name); names are only looked up to draw
+    doctrine_counts = [0] * len(DOCTRINE_NAMES)
+    archetype_counts = [0] * len(ARCHETYPE_NAMES)
+    for npc in world.npcs:
+        total_money += npc.money
+        total_coherence += npc.coherence
+        total_trust += npc.trustworthiness
+        total_stress += npc.stress_endured
+        if npc.is_collapsing:
+            collapsed += 1
+        if npc.is_guru:
+            gurus += 1
+        if npc.doctrine_profile:
+            indoctrinated += 1
+            doctrine_counts[doctrine_id(npc.doctrine_profile.doctrine_type)] += 1
+        if npc.zone == "PANTHEON":
+            pantheon_active += 1
+        pantheon_visits_total += npc.pantheon_visit_count
+        archetype_counts[archetype_id(npc.archetype)] += 1
+    
+    population = len(world.npcs)
+    avg_coherence = total_coherence / population if population else 0
+    avg_trust = total_trust / population if population else 0
+    avg_stress = total_stress / population if population else 0
     
     # === WORLD OVERVIEW ===
-    section_title = fonts['large'].render("🌍 World Overview", True, COLORS['YELLOW_TEXT'])
-    panel_surf.blit(section_title, (20, y_offset))
-    y_offset += 40
-    
-    total_money = sum(npc.money for npc in world.npcs)
-    avg_coherence = sum(npc.coherence for npc in world.npcs) / len(world.npcs) if world.npcs else 0
-    avg_trust = sum(npc.trustworthiness for npc in world.npcs) / len(world.npcs) if world.npcs else 0
-    avg_stress = sum(npc.stress_endured for npc in world.npcs) / len(world.npcs) if world.npcs else 0
-    collapsed = sum(1 for npc in world.npcs if npc.is_collapsing)
+    y_offset = 70 + 40
     
     overview_stats = [
-        f"Total NPCs: {len(world.npcs)}",
+        f"Total NPCs: {population}",
         f"Total Wealth: ${total_money:.1f}",
         f"Avg Coherence: {avg_coherence:.2f}",
         f"Avg Trust: {avg_trust:.2f}",
@@ -196,47 +309,37 @@ def draw_statistics_dashboard(surface, world, active_events, fonts, width, heigh
     ]
     
     for stat in overview_stats:
-        text = fonts['small'].render(stat, True, COLORS['WHITE'])
+        text = render_value_text(fonts['small'], stat, COLORS['WHITE'])
         panel_surf.blit(text, (40, y_offset))
         y_offset += 28
     
     y_offset += 15
     
     # === DOCTRINE STATUS ===
-    section_title = fonts['large'].render("🔮 DOCTRINE SPREAD", True, COLORS['GOLD'])
+    section_title = render_static_text(fonts['large'], "🔮 DOCTRINE SPREAD", COLORS['GOLD'])
     panel_surf.blit(section_title, (20, y_offset))
     y_offset += 40
     
-    # Count indoctrinated by doctrine
-    doctrine_counts = {}
-    for npc in world.npcs:
-        if npc.doctrine_profile:
-            doc_type = npc.doctrine_profile.doctrine_type.value
-            doctrine_counts[doc_type] = doctrine_counts.get(doc_type, 0) + 1
-    
-    if doctrine_counts:
-        for doctrine, count in sorted(doctrine_counts.items()):
-            color = DOCTRINE_COLORS.get(doctrine, COLORS['WHITE'])
-            text = fonts['small'].render(f"  {doctrine}: {count} NPCs", True, color)
+    if indoctrinated:
+        for doc in DOCTRINES_BY_NAME:
+            count = doctrine_counts[doc]
+            if not count:
+                continue
+            text = render_value_text(fonts['small'], f"  {DOCTRINE_NAMES[doc]}: {count} NPCs", DOCTRINE_COLOR_TABLE[doc])
             panel_surf.blit(text, (40, y_offset))
             y_offset += 26
     else:
-        text = fonts['small'].render("  No active doctrines", True, COLORS['GREEN_TEXT'])
+        text = render_static_text(fonts['small'], "  No active doctrines", COLORS['GREEN_TEXT'])
         panel_surf.blit(text, (40, y_offset))
         y_offset += 26
     
     y_offset += 10
     
     # === PANTHEON STATUS ===
-    section_title = fonts['large'].render("🏛️ PANTHEON STATUS", True, COLORS['GOLD'])
+    section_title = render_static_text(fonts['large'], "🏛️ PANTHEON STATUS", COLORS['GOLD'])
     panel_surf.blit(section_title, (20, y_offset))
     y_offset += 40
     
-    gurus = sum(1 for npc in world.npcs if npc.is_guru)
-    indoctrinated = sum(1 for npc in world.npcs if npc.doctrine_profile)
-    pantheon_active = sum(1 for npc in world.npcs if npc.zone == "PANTHEON")
-    pantheon_visits_total = sum(npc.pantheon_visit_count for npc in world.npcs)
-    
     pantheon_stats = [
         f"Permanent Gurus: {gurus}",
         f"Indoctrinated NPCs: {indoctrinated}",
@@ -245,26 +348,22 @@ def draw_statistics_dashboard(surface, world, active_events, fonts, width, heigh
     ]
     
     for stat in pantheon_stats:
-        text = fonts['small'].render(stat, True, COLORS['GOLD'])
+        text = render_value_text(fonts['small'], stat, COLORS['GOLD'])
         panel_surf.blit(text, (40, y_offset))
         y_offset += 28
     
     y_offset += 15
     
     # === ARCHETYPE DISTRIBUTION ===
-    section_title = fonts['large'].render("👥 ARCHETYPES", True, COLORS['YELLOW_TEXT'])
+    section_title = render_static_text(fonts['large'], "👥 ARCHETYPES", COLORS['YELLOW_TEXT'])
     panel_surf.blit(section_title, (20, y_offset))
     y_offset += 40
     
-    archetype_counts = {}
-    for npc in world.npcs:
-        if hasattr(npc, 'archetype'):
-            arch = npc.archetype
-            arch_str = arch.value if hasattr(arch, 'value') else str(arch)
-            archetype_counts[arch_str] = archetype_counts.get(arch_str, 0) + 1
-    
-    for arch, count in sorted(archetype_counts.items()):
-        text = fonts['small'].render(f"  {arch}: {count}", True, COLORS['WHITE'])
+    for arch in ARCHETYPES_BY_NAME:
+        count = archetype_counts[arch]
+        if not count:
+            continue
+        text = render_value_text(fonts['small'], f"  {ARCHETYPE_NAMES[arch]}: {count}", COLORS['WHITE'])
         panel_surf.blit(text, (40, y_offset))
         y_offset += 26
     
@@ -272,25 +371,110 @@ def draw_statistics_dashboard(surface, world, active_events, fonts, width, heigh
     
     # === ACTIVE EVENTS ===
     if active_events:
-        section_title = fonts['large'].render("⚡ ACTIVE EVENTS", True, COLORS['YELLOW_TEXT'])
+        section_title = render_static_text(fonts['large'], "⚡ ACTIVE EVENTS", COLORS['YELLOW_TEXT'])
         panel_surf.blit(section_title, (20, y_offset))
         y_offset += 35
         
         for event in active_events[:5]:
-            event_color = COLORS['GREEN_TEXT'] if hasattr(event, 'effect_type') and event.effect_type == "bonus" else COLORS['RED_TEXT']
-            event_text = f"  {event.name}: {event.remaining_ticks}t left" if hasattr(event, 'remaining_ticks') else f"  {event.name}"
-            text = fonts['tiny'].render(event_text, True, event_color)
+            # Events have no shared type, so optional fields still need one lookup with a default
+            event_color = COLORS['GREEN_TEXT'] if getattr(event, 'effect_type', None) == "bonus" else COLORS['RED_TEXT']
+            remaining = getattr(event, 'remaining_ticks', None)
+            event_text = f"  {event.name}: {remaining}t left" if remaining is not None else f"  {event.name}"
+            text = render_value_text(fonts['tiny'], event_text, event_color)
             panel_surf.blit(text, (40, y_offset))
             y_offset += 22
     
-    # Instructions
-    controls = fonts['tiny'].render("S: Toggle Stats | B: Inspector | ESC: Quit", True, COLORS['YELLOW_TEXT'])
-    panel_surf.blit(controls, (panel_w // 2 - controls.get_width() // 2, panel_h - 30))
-    
-    surface.blit(panel_surf, (panel_x, panel_y))
+    _store_panel("dashboard", cache_key, panel_surf)
+    return [surface.blit(panel_surf, (panel_x, panel_y))]
 
 # ===== NPC RENDERING WITH DOCTRINE RINGS =====
 
+NPC_ZONE_COLORS = {
+    "SCIENCE": (100, 200, 255),
+    "TRADE": COLORS['TRADE_COLOR'],
+    "DEVELOPMENT": COLORS['DEV_COLOR'],
+    "FLEX": COLORS['FLEX_COLOR'],
+    "PANTHEON": COLORS['GOLD'],
+}
+
+# Body + trust ring never depend on the tick, so each color pair is drawn once
+NPC_SPRITE_RADIUS = 11
+_npc_sprites: Dict[Tuple[Tuple[int, int, int], Tuple[int, int, int]], pygame.Surface] = {}
+
+# Overlay rings only take a few hundred (color, radius, width) shapes, cached the same way
+_ring_sprites: Dict[Tuple[Tuple[int, int, int], int, int], pygame.Surface] = {}
+
+def _npc_body_color(npc) -> Tuple[int, int, int]:
+    """Base NPC color from state, cycle phase and work zone"""
+    if npc.state == "AT_HOME":
+        return COLORS['ORANGE'] if npc.cycle_phase != "EXTRACTING" else COLORS['LIME']
+    elif npc.state == "TRAVELING":
+        return COLORS['RED_TEXT'] if npc.cycle_phase == "COMMUTING" else (255, 100, 255)
+    elif npc.state == "AT_WORK":
+        return NPC_ZONE_COLORS.get(npc.zone, COLORS['GREEN'])
+    return COLORS['WHITE']
+
+def _npc_trust_color(npc) -> Tuple[int, int, int]:
+    """Trust ring color (green/yellow/red)"""
+    if npc.trustworthiness > 0.7:
+        return COLORS['GREEN']
+    elif npc.trustworthiness > 0.4:
+        return (255, 255, 0)
+    return (255, 100, 100)
+
+def get_npc_sprite(body_color, trust_color) -> pygame.Surface:
+    """Cached surface with the NPC body circle and trust ring"""
+    key = (body_color, trust_color)
+    sprite = _npc_sprites.get(key)
+    if sprite is None:
+        size = NPC_SPRITE_RADIUS * 2 + 1
+        center = (NPC_SPRITE_RADIUS, NPC_SPRITE_RADIUS)
+        sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, body_color, center, 8)
+        pygame.draw.circle(sprite, trust_color, center, 11, 1)
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()  # Match the display format so blits skip conversion
+        _npc_sprites[key] = sprite
+    return sprite
+
+def get_ring_sprite(color, radius: int, width: int) -> pygame.Surface:
+    """Cached surface with a single ring centered at (radius, radius)"""
+    key = (color, radius, width)
+    sprite = _ring_sprites.get(key)
+    if sprite is None:
+        size = radius * 2 + 1
+        sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, color, (radius, radius), radius, width)
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        _ring_sprites[key] = sprite
+    return sprite
+
+def _pulse_rings(global_tick: int) -> Tuple[pygame.Surface, pygame.Surface, int]:
+    """Collapse ring, guru aura and aura radius for this tick (the pulses only depend on the tick)"""
+    pulse = int(128 + 127 * math.sin(global_tick * 0.1))
+    aura_radius = 18 + int(20 + 10 * math.sin(global_tick * 0.05))
+    return get_ring_sprite((pulse, 0, 0), 14, 3), get_ring_sprite(COLORS['GOLD'], aura_radius, 4), aura_radius
+
+def _npc_ring_blits(npc, x: int, y: int, pulses: Tuple[pygame.Surface, pygame.Surface, int], out: List):
+    """Append (sprite, position) pairs for the tick/strength dependent rings under the NPC body"""
+    # Collapse indicator (red pulsing ring)
+    if npc.is_collapsing:
+        out.append((pulses[0], (x - 14, y - 14)))
+    
+    # Doctrine ring
+    profile = npc.doctrine_profile
+    if profile:
+        doc_color = DOCTRINE_COLOR_TABLE[doctrine_id(profile.doctrine_type)]
+        doc_radius = int(14 + (6 * profile.strength))
+        out.append((get_ring_sprite(doc_color, doc_radius, 2), (x - doc_radius, y - doc_radius)))
+    
+    # Guru aura (pulsing)
+    if npc.is_guru:
+        aura_radius = pulses[2]
+        out.append((pulses[1], (x - aura_radius, y - aura_radius)))
+        out.append((get_ring_sprite(COLORS['WHITE'], 20, 2), (x - 20, y - 20)))
+
 def draw_npc_with_doctrine(surface, npc, position: Tuple[int, int], global_tick: int):
     """
     Draw NPC with doctrine visualization
@@ -300,79 +484,90 @@ def draw_npc_with_doctrine(surface, npc, position: Tuple[int, int], global_tick:
     - Guru aura: pulsing ring if guru
     """
     x, y = int(position[0]), int(position[1])
-    
-    # Determine base color
-    if npc.state == "AT_HOME":
-        color = COLORS['ORANGE'] if npc.cycle_phase != "EXTRACTING" else COLORS['LIME']
-    elif npc.state == "TRAVELING":
-        color = COLORS['RED_TEXT'] if npc.cycle_phase == "COMMUTING" else (255, 100, 255)
-    elif npc.state == "AT_WORK":
-        zone_colors = {
-            "SCIENCE": (100, 200, 255),
-            "TRADE": COLORS['TRADE_COLOR'],
-            "DEVELOPMENT": COLORS['DEV_COLOR'],
-            "FLEX": COLORS['FLEX_COLOR'],
-            "PANTHEON": COLORS['GOLD'],
-        }
-        color = zone_colors.get(npc.zone, COLORS['GREEN'])
-    else:
-        color = COLORS['WHITE']
-    
-    # Draw collapse indicator (red pulsing ring)
-    if npc.is_collapsing:
-        pulse = int(128 + 127 * math.sin(global_tick * 0.1))
-        pygame.draw.circle(surface, (pulse, 0, 0), (x, y), 14, 3)
-    
-    # Draw doctrine ring
-    if npc.doctrine_profile:
-        doc_color = DOCTRINE_COLORS.get(npc.doctrine_profile.doctrine_type.value, COLORS['WHITE'])
-        doc_radius = int(14 + (6 * npc.doctrine_profile.strength))
-        pygame.draw.circle(surface, doc_color, (x, y), doc_radius, 2)
-    
-    # Draw guru aura (pulsing)
-    if npc.is_guru:
-        pulse = int(20 + 10 * math.sin(global_tick * 0.05))
-        pygame.draw.circle(surface, COLORS['GOLD'], (x, y), 18 + pulse, 4)
-        pygame.draw.circle(surface, COLORS['WHITE'], (x, y), 20, 2)
-    
-    # Main NPC circle
-    pygame.draw.circle(surface, color, (x, y), 8)
-    
-    # Trust ring (green/yellow/red)
-    if npc.trustworthiness > 0.7:
-        trust_color = COLORS['GREEN']
-    elif npc.trustworthiness > 0.4:
-        trust_color = (255, 255, 0)
-    else:
-        trust_color = (255, 100, 100)
-    
-    pygame.draw.circle(surface, trust_color, (x, y), 11, 1)
+    blit_seq = []
+    _npc_ring_blits(npc, x, y, _pulse_rings(global_tick), blit_seq)
+    sprite = get_npc_sprite(_npc_body_color(npc), _npc_trust_color(npc))
+    blit_seq.append((sprite, (x - NPC_SPRITE_RADIUS, y - NPC_SPRITE_RADIUS)))
+    surface.blits(blit_seq, False)
+
+def draw_npcs_with_doctrine(surface, placed_npcs, global_tick: int):
+    """
+    Draw many NPCs as one batched blits() call: every ring first, then every body
+    placed_npcs: iterable of (npc, (x, y))
+    """
+    pulses = _pulse_rings(global_tick)  # Once per frame, shared by every NPC
+    ring_seq = []
+    body_seq = []
+    for npc, position in placed_npcs:
+        x, y = int(position[0]), int(position[1])
+        if npc.is_collapsing or npc.doctrine_profile or npc.is_guru:
+            _npc_ring_blits(npc, x, y, pulses, ring_seq)
+        sprite = get_npc_sprite(_npc_body_color(npc), _npc_trust_color(npc))
+        body_seq.append((sprite, (x - NPC_SPRITE_RADIUS, y - NPC_SPRITE_RADIUS)))
+    ring_seq += body_seq
+    surface.blits(ring_seq, False)
+
+def warm_npc_sprites():
+    """Pre-render every NPC body and ring sprite the views can ask for (needs a display mode set)"""
+    body_colors = {
+        COLORS['ORANGE'], COLORS['LIME'], COLORS['RED_TEXT'], (255, 100, 255),
+        COLORS['GREEN'], COLORS['WHITE'], *NPC_ZONE_COLORS.values(),
+    }
+    for body_color in body_colors:
+        for trust_color in (COLORS['GREEN'], (255, 255, 0), (255, 100, 100)):
+            get_npc_sprite(body_color, trust_color)
+    
+    for pulse in range(1, 256):
+        get_ring_sprite((pulse, 0, 0), 14, 3)
+    for doc_color in DOCTRINE_COLOR_TABLE:
+        for doc_radius in range(14, 21):
+            get_ring_sprite(doc_color, doc_radius, 2)
+    for aura_radius in range(28, 49):
+        get_ring_sprite(COLORS['GOLD'], aura_radius, 4)
+    get_ring_sprite(COLORS['WHITE'], 20, 2)
 
 # ===== CORNER PANELS =====
 
+_money = attrgetter('money')
+_coherence = attrgetter('coherence')
+_state = attrgetter('state')
+_is_collapsing = attrgetter('is_collapsing')
+
+# Left and right corner panel labels, one per line
+CORNER_LABELS = (
+    ("Tick: ", "Active: ", "Wealth: $"),
+    ("NPCs: ", "Avg Coh: ", "Collapsed: "),
+)
+
 def draw_corner_stats(surface, world, global_tick, fonts, width, height):
     """Draw mini stat panels in corners"""
     corner_size = 240
     
-    # Sample NPC for tick info
-    sample_npc = world.npcs[0] if world.npcs else None
-    
-    total_wealth = sum(npc.money for npc in world.npcs)
-    avg_coherence = sum(npc.coherence for npc in world.npcs) / len(world.npcs) if world.npcs else 0
-    active_npcs = sum(1 for n in world.npcs if n.state != "AT_HOME")
-    collapsed_npcs = sum(1 for n in world.npcs if n.is_collapsing)
+    # Whole-population reductions run inside sum()/countOf() over attrgetter maps, not Python generators
+    npcs = world.npcs
+    population = len(npcs)
+    total_wealth = sum(map(_money, npcs))
+    avg_coherence = sum(map(_coherence, npcs)) / population if population else 0
+    active_npcs = population - countOf(map(_state, npcs), "AT_HOME")
+    collapsed_npcs = countOf(map(_is_collapsing, npcs), True)
     
+    # Static labels and their values are rendered separately, so only new values rasterize
     corners = [
-        (0, 0, f"Tick: {global_tick}\nActive: {active_npcs}\nWealth: ${total_wealth:.0f}"),
-        (width - corner_size, 0, f"NPCs: {len(world.npcs)}\nAvg Coh: {avg_coherence:.2f}\nCollapsed: {collapsed_npcs}"),
+        (0, 0, CORNER_LABELS[0], (f"{global_tick}", f"{active_npcs}", f"{total_wealth:.0f}")),
+        (width - corner_size, 0, CORNER_LABELS[1], (f"{population}", f"{avg_coherence:.2f}", f"{collapsed_npcs}")),
     ]
     
-    for x, y, text in corners:
+    font = fonts['small']
+    color = COLORS['GREEN_TEXT']
+    for x, y, labels, values in corners:
         pygame.draw.rect(surface, (30, 30, 30, 180), (x, y, corner_size, corner_size), border_radius=18)
-        lines = text.split('\n')
-        for i, line in enumerate(lines):
-            text_surf = fonts['small'].render(line, True, COLORS['GREEN_TEXT'])
-            surface.blit(text_surf, (x + 16, y + 16 + i * 28))
+        blit_seq = []
+        for i, (label, value) in enumerate(zip(labels, values)):
+            line_y = y + 16 + i * 28
+            label_surf = render_static_text(font, label, color)
+            blit_seq.append((label_surf, (x + 16, line_y)))
+            blit_seq.append((render_value_text(font, value, color), (x + 16 + label_surf.get_width(), line_y)))
+        surface.blits(blit_seq, False)
 
 # ===== LEGEND =====
 
@@ -380,7 +575,7 @@ def draw_color_legend(surface, x: int, y: int, corner_size: int, fonts):
     """Draw NPC color legend in corner"""
     pygame.draw.rect(surface, (30, 30, 30, 180), (x, y, corner_size, corner_size), border_radius=18)
     
-    title = fonts['small'].render("NPC Colors", True, COLORS['YELLOW_TEXT'])
+    title = render_static_text(fonts['small'], "NPC Colors", COLORS['YELLOW_TEXT'])
     surface.blit(title, (x + 16, y + 16))
     
     legend_entries = [
@@ -394,6 +589,6 @@ def draw_color_legend(surface, x: int, y: int, corner_size: int, fonts):
     y_offset = y + 50
     for label, color in legend_entries:
         pygame.draw.circle(surface, color, (x + 20, y_offset + 8), 6)
-        text = fonts['tiny'].render(label, True, COLORS['WHITE'])
+        text = render_static_text(fonts['tiny'], label, COLORS['WHITE'])
         surface.blit(text, (x + 35, y_offset))
         y_offset += 24
\ No newline at end of file
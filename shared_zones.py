@@ -6,7 +6,10 @@ Used by 99.py (multi-world simulation)
 
 import pygame
 import math
-from typing import Dict, List
+import threading
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+from rendering import render_static_text, render_value_text
 
 ZONE_COLORS = {
     "PANTHEON": (255, 215, 0),      # Gold
@@ -32,23 +35,119 @@ COLORS = {
     'RED_TEXT': (200, 50, 50),
 }
 
+# NPC dots are a filled circle with a white outline; each (color, radius, outline) shape is drawn once
+_dot_sprites: Dict[Tuple[Tuple[int, int, int], int, int], pygame.Surface] = {}
+
+def get_dot_sprite(color, radius: int, outline_radius: int) -> pygame.Surface:
+    """Cached surface with a filled dot and its 1px white outline, centered at outline_radius"""
+    key = (color, radius, outline_radius)
+    sprite = _dot_sprites.get(key)
+    if sprite is None:
+        size = outline_radius * 2 + 1
+        center = (outline_radius, outline_radius)
+        sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, color, center, radius)
+        pygame.draw.circle(sprite, COLORS['WHITE'], center, outline_radius, 1)
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()  # Match the display format so blits skip conversion
+        _dot_sprites[key] = sprite
+    return sprite
+
+# Zone discs: outline ring over a translucent fill, cached per (color, radius, ring width, fill inset, fill alpha)
+_zone_discs: Dict[Tuple[Tuple[int, int, int], int, int, int, int], pygame.Surface] = {}
+
+def get_zone_disc(color, radius: int, width: int, inset: int, alpha: int) -> pygame.Surface:
+    """Cached SRCALPHA disc centered at radius; the fill keeps its alpha when blitted onto the display"""
+    key = (color, radius, width, inset, alpha)
+    disc = _zone_discs.get(key)
+    if disc is None:
+        size = radius * 2 + 1
+        center = (radius, radius)
+        disc = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(disc, (*color, alpha), center, radius - inset)
+        pygame.draw.circle(disc, color, center, radius, width)
+        if pygame.display.get_surface() is not None:
+            disc = disc.convert_alpha()
+        _zone_discs[key] = disc
+    return disc
+
+# Translucent panel backgrounds, cached per (size, RGBA color, corner radius)
+_panel_backdrops: Dict[Tuple[Tuple[int, int], Tuple[int, int, int, int], int], pygame.Surface] = {}
+
+def get_panel_backdrop(size: Tuple[int, int], color, border_radius: int = 0) -> pygame.Surface:
+    """Cached SRCALPHA panel filled with an RGBA color, so its alpha survives the blit"""
+    key = (size, color, border_radius)
+    backdrop = _panel_backdrops.get(key)
+    if backdrop is None:
+        backdrop = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.rect(backdrop, color, backdrop.get_rect(), border_radius=border_radius)
+        if pygame.display.get_surface() is not None:
+            backdrop = backdrop.convert_alpha()
+        _panel_backdrops[key] = backdrop
+    return backdrop
+
+# Dot layouts never change, so the polar offsets are worked out (and truncated to pixels) once at import
+ARC_DOTS_MAX = 15     # Dots shown per territory in the combined view
+SECTOR_DOTS_MAX = 20  # Dots shown per territory sector in the zone detail view
+
+# (dx, dy) per arc start angle: dot i sits at angle_offset + 10*i degrees, 35/50/65px out
+_ARC_OFFSETS = {
+    angle_offset: tuple(
+        (int(math.cos(math.radians(angle_offset + (i * 10))) * (35 + (i % 3) * 15)),
+         int(math.sin(math.radians(angle_offset + (i * 10))) * (35 + (i % 3) * 15)))
+        for i in range(ARC_DOTS_MAX)
+    )
+    for angle_offset in (0, 120, 240)
+}
+
+# (dx, dy) per (sector start, shown dots): n dots spread evenly across the 120 degree sector
+_SECTOR_OFFSETS = {
+    (start_angle, n): tuple(
+        (int(math.cos(math.radians(start_angle + (i + 1) * (120 / (n + 1)))) * (50 + (i % 4) * 25)),
+         int(math.sin(math.radians(start_angle + (i + 1) * (120 / (n + 1)))) * (50 + (i % 4) * 25)))
+        for i in range(n)
+    )
+    for start_angle in (0, 120, 240)
+    for n in range(1, SECTOR_DOTS_MAX + 1)
+}
+
 # ===== SHARED ZONES TRACKER =====
 
+SHARED_ZONE_NAMES = ("PANTHEON", "SCIENCE", "TRADE", "DEVELOPMENT", "FLEX")
+TERRITORY_COUNT = 3  # Territories are numbered 1..TERRITORY_COUNT
+RECENT_EVENTS_PER_ZONE = 10  # Events the zone detail view lists
+EVENT_HISTORY = 8192  # Events kept in the tracker-wide log before the oldest drop off
+
+# Status block pieces for format_all_shared_zones; the per-zone line is fixed to the 3 territories
+_STATUS_HEADER = "\n" + "="*60 + "\n🌐 SHARED ZONES ACROSS ALL TERRITORIES\n" + "="*60
+_ZONE_STATUS = "\n%s:\n  Zone 1: %d | Zone 2: %d | Zone 3: %d\n  Total cross-territory NPCs: %d"
+
 class SharedZoneTracker:
     """
     Tracks NPCs at shared zones across all 3 territories
     """
     
     def __init__(self):
-        # Shared zone occupants: zone_name -> {zone_1: set, zone_2: set, zone_3: set}
+        # Shared zone occupants: zone_name -> one bitmask per territory (bit npc_id set), indexed territory - 1
         self.shared_zones = {
-            "PANTHEON": {"zone_1": set(), "zone_2": set(), "zone_3": set()},
-            "SCIENCE": {"zone_1": set(), "zone_2": set(), "zone_3": set()},
-            "TRADE": {"zone_1": set(), "zone_2": set(), "zone_3": set()},
-            "DEVELOPMENT": {"zone_1": set(), "zone_2": set(), "zone_3": set()},
-            "FLEX": {"zone_1": set(), "zone_2": set(), "zone_3": set()},
+            zone_name: [0] * TERRITORY_COUNT
+            for zone_name in SHARED_ZONE_NAMES
         }
-        self.events = []
+        # Event log entries are (tick, npc_id, zone_name, territory, "ENTER"/"LEAVE"); territory is None on LEAVE
+        self.events = deque(maxlen=EVENT_HISTORY)
+        
+        # Newest events per zone, kept as they are logged so views never scan the full history
+        self.recent_events = {
+            zone_name: deque(maxlen=RECENT_EVENTS_PER_ZONE)
+            for zone_name in SHARED_ZONE_NAMES
+        }
+        
+        # Stats per zone, dropped whenever that zone's occupants change
+        self._stats_cache: Dict[str, Dict] = {}
+        self._diversities: Optional[Dict[str, float]] = None  # All zones, dropped on any occupant change
+        
+        # Guards shared_zones/events/recent_events/_stats_cache/_diversities when logging runs off the main thread
+        self.lock = threading.Lock()
         
         # Visual layout for shared zones (normalized 0-1)
         self.zone_positions = {
@@ -58,147 +157,216 @@ class SharedZoneTracker:
             "DEVELOPMENT": (0.35, 0.75),
             "FLEX": (0.65, 0.75),
         }
+        # (zone_name, x, y) pixel centers per (width, height, top offset), see zone_screen_positions
+        self._screen_positions: Dict[Tuple[int, int, int], Tuple[Tuple[str, int, int], ...]] = {}
     
     def npc_enters_shared_zone(self, npc_id: int, zone_name: str, origin_territory: int, tick: int):
         """Log NPC entering shared zone"""
-        territory_key = f"zone_{origin_territory}"
-        if zone_name in self.shared_zones and territory_key in self.shared_zones[zone_name]:
-            self.shared_zones[zone_name][territory_key].add(npc_id)
-            self.events.append({
-                "tick": tick,
-                "npc_id": npc_id,
-                "zone": zone_name,
-                "territory": origin_territory,
-                "event": "ENTER",
-            })
+        territories = self.shared_zones.get(zone_name)
+        if territories is not None and 1 <= origin_territory <= TERRITORY_COUNT:
+            event = (tick, npc_id, zone_name, origin_territory, "ENTER")
+            with self.lock:
+                territories[origin_territory - 1] |= 1 << npc_id
+                self._stats_cache.pop(zone_name, None)
+                self._diversities = None
+                self.events.append(event)
+                self.recent_events[zone_name].append(event)
+    
+    def bulk_log(self, entries: Iterable[Tuple[int, str, int]], tick: int):
+        """Log a snapshot of (npc_id, zone_name, origin_territory) shared-zone visits"""
+        shared = self.shared_zones
+        recent = self.recent_events
+        stats_cache = self._stats_cache
+        append_event = self.events.append
+        
+        with self.lock:
+            for npc_id, zone_name, origin_territory in entries:
+                territories = shared.get(zone_name)
+                if territories is None or not 1 <= origin_territory <= TERRITORY_COUNT:
+                    continue
+                territories[origin_territory - 1] |= 1 << npc_id
+                stats_cache.pop(zone_name, None)
+                event = (tick, npc_id, zone_name, origin_territory, "ENTER")
+                append_event(event)
+                recent[zone_name].append(event)
+            self._diversities = None
     
     def npc_leaves_shared_zone(self, npc_id: int, zone_name: str, tick: int):
         """Log NPC leaving shared zone"""
-        for territory_key in ["zone_1", "zone_2", "zone_3"]:
-            self.shared_zones[zone_name][territory_key].discard(npc_id)
-        self.events.append({
-            "tick": tick,
-            "npc_id": npc_id,
-            "zone": zone_name,
-            "event": "LEAVE",
-        })
+        keep = ~(1 << npc_id)
+        with self.lock:
+            territories = self.shared_zones[zone_name]
+            for i in range(TERRITORY_COUNT):
+                territories[i] &= keep
+            self._stats_cache.pop(zone_name, None)
+            self._diversities = None
+            event = (tick, npc_id, zone_name, None, "LEAVE")
+            self.events.append(event)
+            self.recent_events[zone_name].append(event)
     
     def get_shared_zone_stats(self, zone_name: str) -> Dict:
-        """Get statistics for a shared zone"""
+        """Get statistics for a shared zone (cached until its occupants change)"""
         if zone_name not in self.shared_zones:
             return {}
         
-        z1_count = len(self.shared_zones[zone_name]["zone_1"])
-        z2_count = len(self.shared_zones[zone_name]["zone_2"])
-        z3_count = len(self.shared_zones[zone_name]["zone_3"])
-        
-        return {
-            "zone_name": zone_name,
-            "zone_1_occupants": z1_count,
-            "zone_2_occupants": z2_count,
-            "zone_3_occupants": z3_count,
-            "total_occupants": z1_count + z2_count + z3_count,
-        }
+        with self.lock:
+            return self._zone_stats_locked(zone_name)
+    
+    def _zone_stats_locked(self, zone_name: str) -> Dict:
+        """Cached stats for a known shared zone; the caller holds self.lock"""
+        stats = self._stats_cache.get(zone_name)
+        if stats is None:
+            z1, z2, z3 = self.shared_zones[zone_name]
+            z1_count = z1.bit_count()
+            z2_count = z2.bit_count()
+            z3_count = z3.bit_count()
+            stats = {
+                "zone_name": zone_name,
+                "zone_1_occupants": z1_count,
+                "zone_2_occupants": z2_count,
+                "zone_3_occupants": z3_count,
+                "total_occupants": z1_count + z2_count + z3_count,
+            }
+            self._stats_cache[zone_name] = stats
+        return stats
+    
+    def zone_screen_positions(self, width: int, height: int, top: int = 0) -> Tuple[Tuple[str, int, int], ...]:
+        """(zone_name, x, y) of every zone scaled to the screen, cached per screen size"""
+        key = (width, height, top)
+        positions = self._screen_positions.get(key)
+        if positions is None:
+            positions = tuple(
+                (zone_name, int(norm_x * width), int(norm_y * height) + top)
+                for zone_name, (norm_x, norm_y) in self.zone_positions.items()
+            )
+            self._screen_positions[key] = positions
+        return positions
+    
+    def all_diversities(self) -> Dict[str, float]:
+        """Diversity index of every shared zone (cached until any occupants change)"""
+        # Checked, built and stored in one critical section so a concurrent bulk_log can't leave a stale or mixed index
+        with self.lock:
+            diversities = self._diversities
+            if diversities is None:
+                diversities = {
+                    zone_name: calculate_diversity(self._zone_stats_locked(zone_name))
+                    for zone_name in self.shared_zones
+                }
+                self._diversities = diversities
+        return diversities
+    
+    def format_all_shared_zones(self) -> str:
+        """Status of all shared zones as one printable block"""
+        lines = [_STATUS_HEADER]
+        for zone_name in self.shared_zones:
+            stats = self.get_shared_zone_stats(zone_name)
+            lines.append(_ZONE_STATUS % (
+                zone_name, stats['zone_1_occupants'], stats['zone_2_occupants'],
+                stats['zone_3_occupants'], stats['total_occupants'],
+            ))
+        return "\n".join(lines)
     
     def print_all_shared_zones(self):
         """Print status of all shared zones"""
-        print("\n" + "="*60)
-        print("🌐 SHARED ZONES ACROSS ALL TERRITORIES")
-        print("="*60)
-        for zone_name in self.shared_zones:
-            stats = self.get_shared_zone_stats(zone_name)
-            print(f"\n{zone_name}:")
-            print(f"  Zone 1: {stats['zone_1_occupants']} | Zone 2: {stats['zone_2_occupants']} | Zone 3: {stats['zone_3_occupants']}")
-            print(f"  Total cross-territory NPCs: {stats['total_occupants']}")
+        print(self.format_all_shared_zones())
 
 # ===== VISUAL RENDERING FUNCTIONS =====
 
+# (territory, start angle, end angle, label, stats key); the detail view's sectors and the combined view's arc starts
+_TERRITORY_SECTIONS = (
+    (1, 0, 120, "T1", 'zone_1_occupants'),
+    (2, 120, 240, "T2", 'zone_2_occupants'),
+    (3, 240, 360, "T3", 'zone_3_occupants'),
+)
+
+def _blit_centered(surface, text: pygame.Surface, center_x: int, y: int):
+    """Blit a rendered line horizontally centered on center_x"""
+    surface.blit(text, (center_x - text.get_width() // 2, y))
+
+def _territory_dot_blits(territory_num: int, start_angle: int, count: int, x: int, y: int,
+                         detailed: bool) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+    """(sprite, position) pairs for one territory's NPC dots around the zone centered at (x, y)"""
+    if count <= 0:
+        return []
+    radius, outline = (6, 8) if detailed else (5, 6)
+    dot = get_dot_sprite(TERRITORY_COLORS[territory_num], radius, outline)
+    if detailed:
+        offsets = _SECTOR_OFFSETS[start_angle, min(count, SECTOR_DOTS_MAX)]
+    else:
+        offsets = _ARC_OFFSETS[start_angle][:count]  # Capped at ARC_DOTS_MAX
+    left, top = x - outline, y - outline  # Offsets are shifted to the sprite corner
+    return [(dot, (left + dx, top + dy)) for dx, dy in offsets]
+
 def draw_shared_zones_view(surface, shared_zones, fonts, width, height):
     """Draw VISUAL spatial view of all shared zones with NPCs"""
     surface.fill(COLORS['BLACK'])
     
     # Title
-    title = fonts['header'].render("🌐 SHARED ZONES - CROSS-TERRITORY VIEW", True, COLORS['CYAN'])
-    surface.blit(title, (width // 2 - title.get_width() // 2, 20))
+    title = render_static_text(fonts['header'], "🌐 SHARED ZONES - CROSS-TERRITORY VIEW", COLORS['CYAN'])
+    _blit_centered(surface, title, width // 2, 20)
     
     # Territory legend (top-right)
     legend_x = width - 250
     legend_y = 20
-    pygame.draw.rect(surface, (30, 30, 30, 180), (legend_x, legend_y, 230, 140), border_radius=10)
+    surface.blit(get_panel_backdrop((230, 140), (30, 30, 30, 180), 10), (legend_x, legend_y))
     
-    legend_title = fonts['small'].render("Territories:", True, COLORS['WHITE'])
+    legend_title = render_static_text(fonts['small'], "Territories:", COLORS['WHITE'])
     surface.blit(legend_title, (legend_x + 10, legend_y + 10))
     
     for i, (terr_num, color) in enumerate(TERRITORY_COLORS.items()):
         y = legend_y + 40 + i * 30
         pygame.draw.circle(surface, color, (legend_x + 30, y), 8)
         pygame.draw.circle(surface, COLORS['WHITE'], (legend_x + 30, y), 10, 1)
-        text = fonts['tiny'].render(f"Territory {terr_num}", True, COLORS['WHITE'])
+        text = render_static_text(fonts['tiny'], f"Territory {terr_num}", COLORS['WHITE'])
         surface.blit(text, (legend_x + 50, y - 10))
     
     # Draw each shared zone as spatial area
-    for zone_name, (norm_x, norm_y) in shared_zones.zone_positions.items():
-        zone_x = int(norm_x * width)
-        zone_y = int(norm_y * height) + 80  # Offset for title
+    # Stats are gathered once and shared by the zone drawings and the traffic panel
+    stats_by_zone = {zone_name: shared_zones.get_shared_zone_stats(zone_name) for zone_name in SHARED_ZONE_NAMES}
+    
+    for zone_name, zone_x, zone_y in shared_zones.zone_screen_positions(width, height, 80):  # Offset for title
         zone_color = ZONE_COLORS.get(zone_name, COLORS['WHITE'])
-        stats = shared_zones.get_shared_zone_stats(zone_name)
+        stats = stats_by_zone[zone_name]
         
-        # Zone base circle (large)
+        # Zone base circle (large), name above it, then NPCs from each territory as colored dots in an arc
         zone_radius = 80
-        pygame.draw.circle(surface, zone_color, (zone_x, zone_y), zone_radius, 4)
-        pygame.draw.circle(surface, (*zone_color, 30), (zone_x, zone_y), zone_radius - 5)
-        
-        # Zone name
-        zone_label = fonts['large'].render(zone_name, True, zone_color)
-        surface.blit(zone_label, (zone_x - zone_label.get_width() // 2, zone_y - zone_radius - 30))
-        
-        # Draw NPCs from each territory as colored dots
-        territory_data = [
-            (1, stats['zone_1_occupants'], 0),
-            (2, stats['zone_2_occupants'], 120),
-            (3, stats['zone_3_occupants'], 240),
+        zone_label = render_static_text(fonts['large'], zone_name, zone_color)
+        blit_seq = [
+            (get_zone_disc(zone_color, zone_radius, 4, 5, 30), (zone_x - zone_radius, zone_y - zone_radius)),
+            (zone_label, (zone_x - zone_label.get_width() // 2, zone_y - zone_radius - 30)),
         ]
+        for territory_num, angle_offset, _, _, stat_key in _TERRITORY_SECTIONS:
+            blit_seq += _territory_dot_blits(territory_num, angle_offset, stats[stat_key], zone_x, zone_y, False)
+        surface.blits(blit_seq, False)
         
-        for territory_num, count, angle_offset in territory_data:
-            if count > 0:
+        # Count badges for territories with more NPCs than dots
+        for territory_num, angle_offset, _, _, stat_key in _TERRITORY_SECTIONS:
+            count = stats[stat_key]
+            if count > ARC_DOTS_MAX:
                 color = TERRITORY_COLORS[territory_num]
-                
-                # Arrange NPCs in arc around zone
-                for i in range(min(count, 15)):  # Cap visual display at 15
-                    angle = math.radians(angle_offset + (i * 10))
-                    offset_dist = 35 + (i % 3) * 15
-                    npc_x = zone_x + int(math.cos(angle) * offset_dist)
-                    npc_y = zone_y + int(math.sin(angle) * offset_dist)
-                    
-                    # NPC dot
-                    pygame.draw.circle(surface, color, (npc_x, npc_y), 5)
-                    pygame.draw.circle(surface, COLORS['WHITE'], (npc_x, npc_y), 6, 1)
-                
-                # Count badge
-                if count > 15:
-                    badge_text = fonts['tiny'].render(f"+{count - 15}", True, color)
-                    angle = math.radians(angle_offset + 60)
-                    badge_x = zone_x + int(math.cos(angle) * 55)
-                    badge_y = zone_y + int(math.sin(angle) * 55)
-                    surface.blit(badge_text, (badge_x, badge_y))
+                badge_text = fonts['tiny'].render(f"+{count - ARC_DOTS_MAX}", True, color)
+                angle = math.radians(angle_offset + 60)
+                badge_x = zone_x + int(math.cos(angle) * 55)
+                badge_y = zone_y + int(math.sin(angle) * 55)
+                surface.blit(badge_text, (badge_x, badge_y))
         
         # Total occupants badge (center)
         total = stats['total_occupants']
         if total > 0:
             total_text = fonts['small'].render(str(total), True, COLORS['GOLD'])
-            surface.blit(total_text, (zone_x - total_text.get_width() // 2, zone_y - 10))
+            _blit_centered(surface, total_text, zone_x, zone_y - 10)
     
     # Statistics panel (bottom)
     panel_y = height - 150
-    pygame.draw.rect(surface, (20, 20, 40, 200), (0, panel_y, width, 150))
+    surface.blit(get_panel_backdrop((width, 150), (20, 20, 40, 200)), (0, panel_y))
     
-    stats_title = fonts['large'].render("CROSS-TERRITORY TRAFFIC", True, COLORS['LIME'])
+    stats_title = render_static_text(fonts['large'], "CROSS-TERRITORY TRAFFIC", COLORS['LIME'])
     surface.blit(stats_title, (20, panel_y + 10))
     
     # Summary stats
     y_offset = panel_y + 50
-    for i, zone_name in enumerate(["PANTHEON", "SCIENCE", "TRADE", "DEVELOPMENT", "FLEX"]):
-        stats = shared_zones.get_shared_zone_stats(zone_name)
+    for i, zone_name in enumerate(SHARED_ZONE_NAMES):
+        stats = stats_by_zone[zone_name]
         total = stats['total_occupants']
         color = ZONE_COLORS[zone_name]
         
@@ -211,7 +379,7 @@ def draw_shared_zones_view(surface, shared_zones, fonts, width, height):
         surface.blit(text, (x_pos, y_pos))
     
     # Controls hint
-    controls = fonts['tiny'].render("C: Exit Combined View | P/N/T: Specific Zones", True, COLORS['YELLOW_TEXT'])
+    controls = render_static_text(fonts['tiny'], "C: Exit Combined View | P/N/T: Specific Zones", COLORS['YELLOW_TEXT'])
     surface.blit(controls, (width - controls.get_width() - 20, height - 20))
 
 def draw_specific_shared_zone(surface, shared_zones, zone_name: str, fonts, width, height):
@@ -222,8 +390,8 @@ def draw_specific_shared_zone(surface, shared_zones, zone_name: str, fonts, widt
     zone_color = ZONE_COLORS.get(zone_name, COLORS['WHITE'])
     
     # Title
-    title = fonts['header'].render(f"🏛️ SHARED {zone_name}", True, zone_color)
-    surface.blit(title, (width // 2 - title.get_width() // 2, 30))
+    title = render_static_text(fonts['header'], f"🏛️ SHARED {zone_name}", zone_color)
+    _blit_centered(surface, title, width // 2, 30)
     
     # Central zone visualization
     center_x = width // 2
@@ -231,19 +399,12 @@ def draw_specific_shared_zone(surface, shared_zones, zone_name: str, fonts, widt
     zone_radius = 150
     
     # Zone base
-    pygame.draw.circle(surface, zone_color, (center_x, center_y), zone_radius, 6)
-    pygame.draw.circle(surface, (*zone_color, 40), (center_x, center_y), zone_radius - 10)
+    surface.blit(get_zone_disc(zone_color, zone_radius, 6, 10, 40), (center_x - zone_radius, center_y - zone_radius))
     
     # Territory sections (3 arcs)
-    territory_sections = [
-        (1, 0, 120, "T1"),
-        (2, 120, 240, "T2"),
-        (3, 240, 360, "T3"),
-    ]
-    
-    for territory_num, start_angle, end_angle, label in territory_sections:
+    for territory_num, start_angle, end_angle, label, stat_key in _TERRITORY_SECTIONS:
         color = TERRITORY_COLORS[territory_num]
-        count = stats[f'zone_{territory_num}_occupants']
+        count = stats[stat_key]
         
         # Draw arc separator
         angle_rad = math.radians(start_angle)
@@ -252,16 +413,7 @@ def draw_specific_shared_zone(surface, shared_zones, zone_name: str, fonts, widt
         pygame.draw.line(surface, COLORS['WHITE'], (center_x, center_y), (line_end_x, line_end_y), 2)
         
         # Draw NPCs in sector
-        if count > 0:
-            angle_range = end_angle - start_angle
-            for i in range(min(count, 20)):
-                angle = math.radians(start_angle + (i + 1) * (angle_range / (min(count, 20) + 1)))
-                dist = 50 + (i % 4) * 25
-                npc_x = center_x + int(math.cos(angle) * dist)
-                npc_y = center_y + int(math.sin(angle) * dist)
-                
-                pygame.draw.circle(surface, color, (npc_x, npc_y), 6)
-                pygame.draw.circle(surface, COLORS['WHITE'], (npc_x, npc_y), 8, 1)
+        surface.blits(_territory_dot_blits(territory_num, start_angle, count, center_x, center_y, True), False)
         
         # Territory label
         label_angle = math.radians((start_angle + end_angle) / 2)
@@ -281,9 +433,9 @@ def draw_specific_shared_zone(surface, shared_zones, zone_name: str, fonts, widt
     panel_w = 350
     panel_h = 400
     
-    pygame.draw.rect(surface, (30, 30, 50, 220), (panel_x, panel_y, panel_w, panel_h), border_radius=10)
+    surface.blit(get_panel_backdrop((panel_w, panel_h), (30, 30, 50, 220), 10), (panel_x, panel_y))
     
-    stats_title = fonts['large'].render("STATISTICS", True, COLORS['LIME'])
+    stats_title = render_static_text(fonts['large'], "STATISTICS", COLORS['LIME'])
     surface.blit(stats_title, (panel_x + 20, panel_y + 20))
     
     y_offset = panel_y + 70
@@ -295,9 +447,10 @@ def draw_specific_shared_zone(surface, shared_zones, zone_name: str, fonts, widt
         f"Total: {stats['total_occupants']} NPCs",
         "",
         "Cross-Territory Mixing:",
-        f"  Diversity Index: {calculate_diversity(stats):.2f}",
+        f"  Diversity Index: {shared_zones.all_diversities().get(zone_name, 0.0):.2f}",
     ]
     
+    stat_seq = []
     for i, line in enumerate(stat_lines):
         if line.startswith("Territory"):
             terr_num = int(line[10])
@@ -307,39 +460,42 @@ def draw_specific_shared_zone(surface, shared_zones, zone_name: str, fonts, widt
         else:
             color = COLORS['WHITE']
         
-        text = fonts['small'].render(line, True, color)
-        surface.blit(text, (panel_x + 20, y_offset + i * 30))
+        stat_seq.append((render_value_text(fonts['small'], line, color), (panel_x + 20, y_offset + i * 30)))
+    surface.blits(stat_seq, False)
     
     # Recent activity (right side)
     activity_x = width - 370
     activity_y = 150
     
-    pygame.draw.rect(surface, (30, 30, 50, 220), (activity_x, activity_y, 350, 400), border_radius=10)
+    surface.blit(get_panel_backdrop((350, 400), (30, 30, 50, 220), 10), (activity_x, activity_y))
     
-    activity_title = fonts['large'].render("RECENT ACTIVITY", True, COLORS['YELLOW_TEXT'])
+    activity_title = render_static_text(fonts['large'], "RECENT ACTIVITY", COLORS['YELLOW_TEXT'])
     surface.blit(activity_title, (activity_x + 20, activity_y + 20))
     
-    # Filter events for this zone
-    recent_events = [e for e in shared_zones.events if e["zone"] == zone_name][-10:]
+    # Last events for this zone (kept per zone by the tracker)
+    with shared_zones.lock:
+        recent_events = list(shared_zones.recent_events.get(zone_name, ()))
     
     y_offset = activity_y + 70
-    for i, event in enumerate(recent_events):
-        event_color = TERRITORY_COLORS[event["territory"]]
-        symbol = "→" if event["event"] == "ENTER" else "←"
-        
-        event_text = f"T{event['territory']} NPC#{event['npc_id']:03d} {symbol}"
-        text = fonts['small'].render(event_text, True, event_color)
-        surface.blit(text, (activity_x + 20, y_offset + i * 30))
+    event_seq = []
+    for i, (tick, npc_id, _, territory, kind) in enumerate(recent_events):
+        event_color = TERRITORY_COLORS[territory]
+        symbol = "→" if kind == "ENTER" else "←"
         
-        tick_text = fonts['tiny'].render(f"Tick {event['tick']}", True, COLORS['WHITE'])
-        surface.blit(tick_text, (activity_x + 250, y_offset + i * 30 + 5))
+        event_text = f"T{territory} NPC#{npc_id:03d} {symbol}"
+        event_seq.append((render_value_text(fonts['small'], event_text, event_color), (activity_x + 20, y_offset + i * 30)))
+        event_seq.append((render_value_text(fonts['tiny'], f"Tick {tick}", COLORS['WHITE']), (activity_x + 250, y_offset + i * 30 + 5)))
+    surface.blits(event_seq, False)
     
     # Controls
-    controls = fonts['tiny'].render(
+    controls = render_static_text(
+        fonts['tiny'],
         "P: Pantheon | N: Science | T: Trade | C: Combined View | ESC: Exit",
-        True, COLORS['WHITE']
+        COLORS['WHITE']
     )
-    surface.blit(controls, (width // 2 - controls.get_width() // 2, height - 20))
+    _blit_centered(surface, controls, width // 2, height - 20)
+
+_INV_LOG3 = 1.0 / math.log(3)  # Normalizes entropy over the 3 territories to 0-1
 
 def calculate_diversity(stats: Dict) -> float:
     """Calculate diversity index (0 = single territory, 1 = perfectly balanced)"""
@@ -347,12 +503,20 @@ def calculate_diversity(stats: Dict) -> float:
     if total == 0:
         return 0.0
     
-    counts = [stats['zone_1_occupants'], stats['zone_2_occupants'], stats['zone_3_occupants']]
-    proportions = [c / total for c in counts if c > 0]
-    
-    if len(proportions) <= 1:
+    # One occupied territory holds everyone: no mixing
+    z1, z2, z3 = stats['zone_1_occupants'], stats['zone_2_occupants'], stats['zone_3_occupants']
+    if total in (z1, z2, z3):
         return 0.0
     
-    # Shannon entropy normalized
-    entropy = -sum(p * math.log(p, 3) for p in proportions if p > 0)
-    return entropy
\ No newline at end of file
+    # Shannon entropy normalized, unrolled over the 3 territories (empty ones contribute nothing)
+    entropy = 0.0
+    if z1:
+        p = z1 / total
+        entropy -= p * math.log(p)
+    if z2:
+        p = z2 / total
+        entropy -= p * math.log(p)
+    if z3:
+        p = z3 / total
+        entropy -= p * math.log(p)
+    return entropy * _INV_LOG3
\ No newline at end of file